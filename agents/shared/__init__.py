@@ -3,6 +3,7 @@ ChaosOracle shared utilities re-exported for convenience.
 """
 
 from shared.arweave_client import ArweaveClient
+from shared.bloom import BloomFilter
 from shared.constants import (
     CHAIN_ID,
     CHAOS_ORACLE_REGISTRY_ADDRESS,
@@ -16,6 +17,7 @@ from shared.constants import (
     WORKER_STAKE_WEI,
 )
 from shared.registry_reader import RegistryReader, StudioDetails, WorkerSubmission
+from shared.state_store import StateStore
 
 # ChaosOracleSDKClient depends on chaoschain_sdk which is only installed in
 # gateway mode.  Import lazily so local-mode containers (which only need
@@ -27,8 +29,10 @@ except ImportError:
 
 __all__ = [
     "ArweaveClient",
+    "BloomFilter",
     "ChaosOracleSDKClient",
     "RegistryReader",
+    "StateStore",
     "StudioDetails",
     "WorkerSubmission",
     # constants
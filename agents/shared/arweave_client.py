@@ -21,18 +21,105 @@ Evidence package schema::
 
 from __future__ import annotations
 
+import asyncio
 import json
+import re
+from collections import OrderedDict
+from datetime import datetime
 from typing import Any
 
 import aiohttp
 import structlog
 
+# orjson serialises straight to bytes from native code and is considerably
+# faster than stdlib json on large evidence packages.  Fall back to stdlib
+# so local dev environments without the extension keep working.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# blake3 is several times faster than SHA-256 on multi-KB payloads.  Stub
+# CIDs are local-dev-only, so the exact hash function is irrelevant to the
+# on-chain consumer; both hexdigests are 64 chars.
+try:
+    from blake3 import blake3 as _stub_hash
+except ImportError:  # pragma: no cover - optional speedup
+    from hashlib import sha256 as _stub_hash
+
+# Arweave storage is priced per byte and evidence packages carry tens of
+# KB of free-form reasoning text, so uploads are zstd-compressed when the
+# library is present.  Fetches always detect compression by magic bytes,
+# so mixed fleets (some agents compressing, some not) interoperate.
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional speedup
+    zstandard = None  # type: ignore[assignment]
+
 logger = structlog.get_logger(__name__)
 
+
+# Evidence packages carry ``timestamp`` as a raw datetime; orjson encodes
+# those natively (OPT_UTC_Z renders UTC offsets as the schema's trailing
+# "Z") while stdlib json needs the fallback below.
+_ORJSON_OPTS = 0 if orjson is None else orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+def _json_default(obj: Any) -> str:
+    """stdlib-json fallback encoder matching orjson's datetime output."""
+    if isinstance(obj, datetime):
+        return obj.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialise *obj* to JSON bytes, preserving insertion order."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+    return json.dumps(obj, default=_json_default).encode()
+
+
+def _dumps_sorted(obj: Any) -> bytes:
+    """Serialise *obj* to JSON bytes with deterministically sorted keys."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, default=_json_default).encode()
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes (or str) using the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Default Arweave gateway for reads.  Uploads go through a bundler service.
 _DEFAULT_ARWEAVE_GATEWAY = "https://arweave.net"
 _DEFAULT_BUNDLER_URL = "https://node2.bundlr.network"
 
+# Stub CIDs are self-identifying: "stub:" + SHA-256 hex (upload_evidence
+# stub mode).  Real Arweave TX IDs are 43-char base64url.  The bare 64-hex
+# shape is still recognised for CIDs minted by older agent versions.
+_STUB_CID_PREFIX = "stub:"
+_HEX64_RE = re.compile(r"\A[0-9a-f]{64}\Z")
+
+# zstd frame header; any payload starting with it was compressed by us
+# (or a peer agent) before upload.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Byte budget for the fetched-evidence cache.  CIDs are immutable, so
+# entries never go stale; the budget just bounds resident memory.
+_FETCH_CACHE_BUDGET_BYTES = 32 * 1024 * 1024
+
+# Shared skeleton for stub fetch responses; only ``reasoning`` varies per
+# CID, so the rest is built once instead of on every verifier iteration.
+_STUB_TEMPLATE: dict[str, Any] = {
+    "question": "(stub evidence — no Arweave wallet configured)",
+    "outcome": 0,
+    "confidence": 0.75,
+    "sources": [],
+    "timestamp": "1970-01-01T00:00:00Z",
+}
+
 
 class ArweaveClient:
     """Upload and download evidence packages to/from Arweave.
@@ -47,6 +134,11 @@ class ArweaveClient:
         Path to an Arweave JWK wallet file (required for uploads in
         production).  When ``None``, uploads use a stub that returns a
         deterministic placeholder CID -- suitable for local testing.
+    session:
+        Externally owned :class:`aiohttp.ClientSession` to use for all
+        HTTP traffic, letting the agent share one keep-alive connection
+        pool across components.  When ``None`` the client lazily creates
+        (and on :meth:`aclose` closes) its own.
     """
 
     def __init__(
@@ -54,10 +146,28 @@ class ArweaveClient:
         gateway_url: str = _DEFAULT_ARWEAVE_GATEWAY,
         bundler_url: str = _DEFAULT_BUNDLER_URL,
         wallet_path: str | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         self._gateway_url = gateway_url.rstrip("/")
         self._bundler_url = bundler_url.rstrip("/")
         self._wallet_path = wallet_path
+        self._session = session
+        self._owns_session = session is None
+
+        # Reused across calls; compressor/decompressor setup is not free.
+        if zstandard is not None:
+            self._zstd_compressor = zstandard.ZstdCompressor(level=3)
+            self._zstd_decompressor = zstandard.ZstdDecompressor()
+        else:  # pragma: no cover - optional speedup
+            self._zstd_compressor = None
+            self._zstd_decompressor = None
+
+        # CID -> (raw byte size, parsed package), LRU-evicted once the
+        # total raw size exceeds the byte budget.  In-flight tasks let
+        # concurrent fetches of the same CID share a single request.
+        self._fetch_cache: OrderedDict[str, tuple[int, dict[str, Any]]] = OrderedDict()
+        self._fetch_cache_bytes = 0
+        self._inflight_fetches: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
         logger.info(
             "arweave_client.initialized",
@@ -66,6 +176,37 @@ class ArweaveClient:
             has_wallet=wallet_path is not None,
         )
 
+    # ------------------------------------------------------------------
+    # Session management
+    # ------------------------------------------------------------------
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it lazily.
+
+        A single session keeps connections alive across uploads and
+        fetches, avoiding a fresh DNS + TCP + TLS handshake per call.
+        """
+        if self._session is None or self._session.closed:
+            self._owns_session = True
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the HTTP session if this client owns it.
+
+        Call from the agent shutdown hook.  Injected sessions belong to
+        the caller and are left open.
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     # ------------------------------------------------------------------
     # Upload
     # ------------------------------------------------------------------
@@ -87,15 +228,15 @@ class ArweaveClient:
         str
             Arweave transaction ID usable as ``evidenceCID``.
         """
-        payload_bytes = json.dumps(evidence_package, sort_keys=True).encode()
-
         if self._wallet_path is not None:
-            return await self._upload_via_bundler(payload_bytes)
+            # The bundler assigns the CID, so key order doesn't matter and
+            # we can skip the sorting pass.
+            return await self._upload_via_bundler(_dumps(evidence_package))
 
         # Stub: produce a deterministic hash-based CID for local development.
-        import hashlib
-
-        cid = hashlib.sha256(payload_bytes).hexdigest()
+        # Sorted keys keep the hash stable across dict orderings.
+        payload_bytes = _dumps_sorted(evidence_package)
+        cid = _STUB_CID_PREFIX + _stub_hash(payload_bytes).hexdigest()
         logger.warning(
             "arweave_client.upload_stub",
             cid=cid,
@@ -120,25 +261,30 @@ class ArweaveClient:
         headers = {
             "Content-Type": "application/json",
         }
+        if self._zstd_compressor is not None:
+            # Bytes on the wire are bytes billed; reasoning-heavy
+            # packages typically compress 3-5x.
+            payload_bytes = self._zstd_compressor.compress(payload_bytes)
+            headers["Content-Encoding"] = "zstd"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=payload_bytes, headers=headers) as resp:
-                    if resp.status in (200, 201):
-                        data = await resp.json()
-                        cid = data.get("id", data.get("txId", ""))
-                        logger.info("arweave_client.uploaded", cid=cid)
-                        return cid
-                    else:
-                        body = await resp.text()
-                        logger.error(
-                            "arweave_client.upload_failed",
-                            status=resp.status,
-                            body=body[:500],
-                        )
-                        raise RuntimeError(
-                            f"Arweave upload failed with status {resp.status}: {body[:200]}"
-                        )
+            session = await self._get_session()
+            async with session.post(url, data=payload_bytes, headers=headers) as resp:
+                if resp.status in (200, 201):
+                    data = await resp.json()
+                    cid = data.get("id", data.get("txId", ""))
+                    logger.info("arweave_client.uploaded", cid=cid)
+                    return cid
+                else:
+                    body = await resp.text()
+                    logger.error(
+                        "arweave_client.upload_failed",
+                        status=resp.status,
+                        body=body[:500],
+                    )
+                    raise RuntimeError(
+                        f"Arweave upload failed with status {resp.status}: {body[:200]}"
+                    )
         except aiohttp.ClientError as exc:
             logger.exception("arweave_client.upload_error")
             raise RuntimeError(f"Arweave upload error: {exc}") from exc
@@ -165,41 +311,79 @@ class ArweaveClient:
         RuntimeError
             If the fetch fails or the response is not valid JSON.
         """
-        # Stub CIDs are 64-char hex SHA-256 hashes (from upload_evidence stub mode).
-        # Real Arweave TX IDs are 43-char base64url.  Don't hit the network for stubs.
-        if len(cid) == 64 and all(c in "0123456789abcdef" for c in cid):
+        # Don't hit the network for stub CIDs produced by upload_evidence.
+        if cid.startswith(_STUB_CID_PREFIX) or _HEX64_RE.match(cid):
             logger.info("arweave_client.fetch_stub", cid=cid)
             return {
-                "question": "(stub evidence — no Arweave wallet configured)",
-                "outcome": 0,
-                "confidence": 0.75,
-                "sources": [],
+                **_STUB_TEMPLATE,
                 "reasoning": f"Stub evidence package for CID {cid}. "
                              "In production this would be fetched from Arweave.",
-                "timestamp": "1970-01-01T00:00:00Z",
             }
 
+        # CIDs are content-addressed and therefore immutable, so cache
+        # hits never need revalidation.
+        cached = self._fetch_cache.get(cid)
+        if cached is not None:
+            self._fetch_cache.move_to_end(cid)
+            logger.debug("arweave_client.fetch_cached", cid=cid)
+            return cached[1]
+
+        # Share one in-flight request among concurrent fetches of a CID.
+        task = self._inflight_fetches.get(cid)
+        if task is None:
+            task = asyncio.create_task(self._fetch_remote(cid))
+            self._inflight_fetches[cid] = task
+            task.add_done_callback(
+                lambda _t, cid=cid: self._inflight_fetches.pop(cid, None)
+            )
+        return await task
+
+    def _cache_store(self, cid: str, size: int, data: dict[str, Any]) -> None:
+        """Insert a fetched package, evicting LRU entries over budget."""
+        self._fetch_cache[cid] = (size, data)
+        self._fetch_cache_bytes += size
+        while self._fetch_cache_bytes > _FETCH_CACHE_BUDGET_BYTES and self._fetch_cache:
+            _evicted_cid, (evicted_size, _pkg) = self._fetch_cache.popitem(last=False)
+            self._fetch_cache_bytes -= evicted_size
+
+    async def _fetch_remote(self, cid: str) -> dict[str, Any]:
+        """Fetch and parse one evidence package from the gateway."""
         url = f"{self._gateway_url}/{cid}"
         logger.info("arweave_client.fetch.start", cid=cid, url=url)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-                    if resp.status != 200:
-                        body = await resp.text()
-                        logger.error(
-                            "arweave_client.fetch_failed",
-                            cid=cid,
-                            status=resp.status,
-                            body=body[:500],
-                        )
+            session = await self._get_session()
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=30),
+                # aiohttp transparently decompresses, so ask for gzip to cut
+                # bytes on the wire for large evidence packages.
+                headers={"Accept-Encoding": "gzip"},
+            ) as resp:
+                if resp.status != 200:
+                    body = await resp.text()
+                    logger.error(
+                        "arweave_client.fetch_failed",
+                        cid=cid,
+                        status=resp.status,
+                        body=body[:500],
+                    )
+                    raise RuntimeError(
+                        f"Arweave fetch failed for {cid}: HTTP {resp.status}"
+                    )
+
+                raw = await resp.read()
+                if raw[:4] == _ZSTD_MAGIC:
+                    if self._zstd_decompressor is None:  # pragma: no cover
                         raise RuntimeError(
-                            f"Arweave fetch failed for {cid}: HTTP {resp.status}"
+                            f"Evidence {cid} is zstd-compressed but the "
+                            "zstandard package is not installed."
                         )
-
-                    data: dict[str, Any] = await resp.json()
-                    logger.info("arweave_client.fetch.done", cid=cid)
-                    return data
+                    raw = self._zstd_decompressor.decompress(raw)
+                data: dict[str, Any] = _loads(raw)
+                self._cache_store(cid, len(raw), data)
+                logger.info("arweave_client.fetch.done", cid=cid)
+                return data
         except aiohttp.ClientError as exc:
             logger.exception("arweave_client.fetch_error", cid=cid)
             raise RuntimeError(f"Arweave fetch error for {cid}: {exc}") from exc
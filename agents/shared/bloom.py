@@ -0,0 +1,68 @@
+"""
+Minimal Bloom filter for agent dedup hot paths.
+
+The agents' dedup sets (``scored_pairs``, ``participated_studios``) are
+consulted once per submission per poll cycle and grow without bound on
+long-lived deployments.  A Bloom filter answers "definitely new" in O(1)
+over a compact bit array, so the exact set -- which must still exist,
+because a Bloom false positive would otherwise skip real work -- is only
+probed for the tiny fraction of keys the filter flags as "maybe seen".
+
+Hand-rolled rather than pulling in ``pybloom-live``: the agents need
+exactly add + membership, and the classic double-hashing construction is
+a dozen lines over a ``bytearray``.
+"""
+
+from __future__ import annotations
+
+import math
+from hashlib import blake2b
+
+
+class BloomFilter:
+    """Space-efficient approximate-membership filter over string keys.
+
+    Parameters
+    ----------
+    expected_items:
+        Sizing target.  The false-positive rate holds while the number
+        of added keys stays at or below this.
+    fp_rate:
+        Target false-positive probability at ``expected_items`` keys.
+
+    Notes
+    -----
+    Membership is one-sided: ``key in filter`` returning ``False`` is
+    definitive, ``True`` means "check the exact set".  Uses k index
+    functions derived from a single blake2b digest via double hashing
+    (h1 + i*h2), which preserves the standard Bloom bounds without k
+    independent hash passes.
+    """
+
+    def __init__(self, expected_items: int, fp_rate: float = 1e-3) -> None:
+        if expected_items < 1:
+            raise ValueError(f"expected_items must be >= 1, got {expected_items}.")
+        if not (0.0 < fp_rate < 1.0):
+            raise ValueError(f"fp_rate must be in (0, 1), got {fp_rate}.")
+
+        # Optimal sizing: m = -n ln p / (ln 2)^2, k = (m/n) ln 2.
+        bits = math.ceil(-expected_items * math.log(fp_rate) / (math.log(2) ** 2))
+        self._num_bits = max(bits, 8)
+        self._num_hashes = max(round((self._num_bits / expected_items) * math.log(2)), 1)
+        self._bits = bytearray((self._num_bits + 7) // 8)
+
+    def _indexes(self, key: str) -> list[int]:
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+
+    def add(self, key: str) -> None:
+        """Mark *key* as seen."""
+        for idx in self._indexes(key):
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[idx >> 3] & (1 << (idx & 7)) for idx in self._indexes(key)
+        )
@@ -74,6 +74,40 @@ REPUTATION_CONTRACT_ADDRESS: str = os.environ.get(
     "0x0000000000000000000000000000000000000000",  # placeholder - set after deployment
 )
 
+# Canonical Multicall3 deployment -- same address on Sepolia, mainnet, and
+# most EVM chains (and therefore on anvil forks of them).  Used to aggregate
+# many view calls into a single eth_call.
+MULTICALL3_ADDRESS: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI: list[dict] = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            },
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            },
+        ],
+    },
+]
+
 # ---------------------------------------------------------------------------
 # Stake amounts (in wei)
 # ---------------------------------------------------------------------------
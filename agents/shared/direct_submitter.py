@@ -10,9 +10,14 @@ No x402 payments, no ERC-8004 identity — just plain web3 calls.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import Any
 
+import requests
 import structlog
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
 
@@ -24,6 +29,9 @@ from shared.constants import (
 
 logger = structlog.get_logger(__name__)
 
+# How long a cached gas price remains valid before re-querying the node.
+_GAS_PRICE_TTL_SECONDS = 5.0
+
 
 class DirectSubmitter:
     """Direct web3 contract calls — replaces ChaosChain Gateway for local mode.
@@ -40,13 +48,51 @@ class DirectSubmitter:
     """
 
     def __init__(self, rpc_url: str, private_key: str) -> None:
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        # A pooled requests session keeps keep-alive connections to the RPC
+        # endpoint instead of re-handshaking per call.
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        self.w3 = Web3(Web3.HTTPProvider(rpc_url, session=session))
         self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
 
         self._account = self.w3.eth.account.from_key(private_key)
         self.wallet_address: str = self._account.address
         self.agent_id: int | None = 0  # No ERC-8004 identity in local mode
 
+        # Studio Contract objects keyed by checksum address.  Construction
+        # parses the ABI and builds bound functions, so cache per studio.
+        self._studio_contracts: dict[str, Any] = {}
+        # Bound ContractFunction factories per studio.  Looking a function
+        # up on ``contract.functions`` walks the ABI by name every time;
+        # binding once leaves only per-call argument encoding.
+        self._studio_fns: dict[str, dict[str, Any]] = {}
+
+        # Locally-managed nonce and a short-TTL gas price cache avoid two
+        # RPC round-trips per transaction built.  Transaction building
+        # runs via asyncio.to_thread from concurrent tasks, so nonce
+        # allocation (and the gas-price cache it reads) is guarded by a
+        # lock -- an unguarded read-then-increment would let two threads
+        # build transactions with the same nonce.
+        self._tx_lock = threading.Lock()
+        self._nonce: int = self.w3.eth.get_transaction_count(
+            self.wallet_address, "pending"
+        )
+        self._gas_price: int = 0
+        self._gas_price_ts: float = 0.0
+
+        # submit_scores fans out per submission, so every concurrent call
+        # for a new studio can observe "not registered" before the first
+        # registerAsVerifier lands -- the extra registrations then revert
+        # with AlreadyRegistered.  Serialize the check+register step per
+        # studio and remember completed registrations.  (submit_work has
+        # the same check, but the worker loop submits per studio
+        # sequentially, so it doesn't race.)
+        self._verifier_reg_locks: dict[str, asyncio.Lock] = {}
+        self._verifier_registered: set[str] = set()
+
         logger.info(
             "direct_submitter.initialized",
             wallet=self.wallet_address,
@@ -59,16 +105,48 @@ class DirectSubmitter:
     # ------------------------------------------------------------------
 
     def _studio_contract(self, studio_address: str):
-        """Return a web3 Contract bound to a studio proxy."""
-        return self.w3.eth.contract(
-            address=Web3.to_checksum_address(studio_address),
-            abi=PREDICTION_SETTLEMENT_LOGIC_ABI,
-        )
-
-    def _send_tx(self, tx_data: dict) -> str:
-        """Sign, send, and wait for a transaction.  Returns the tx hash hex."""
+        """Return a web3 Contract bound to a studio proxy (cached)."""
+        address_cs = Web3.to_checksum_address(studio_address)
+        contract = self._studio_contracts.get(address_cs)
+        if contract is None:
+            contract = self.w3.eth.contract(
+                address=address_cs,
+                abi=PREDICTION_SETTLEMENT_LOGIC_ABI,
+            )
+            self._studio_contracts[address_cs] = contract
+            self._studio_fns[address_cs] = {
+                name: getattr(contract.functions, name)
+                for name in (
+                    "isWorkerRegistered",
+                    "registerAsWorker",
+                    "submitWork",
+                    "isVerifierRegistered",
+                    "registerAsVerifier",
+                    "submitScores",
+                )
+            }
+        return contract
+
+    def _studio_fn(self, studio_address: str, name: str):
+        """Return a pre-bound ContractFunction factory for a studio."""
+        address_cs = Web3.to_checksum_address(studio_address)
+        if address_cs not in self._studio_fns:
+            self._studio_contract(address_cs)
+        return self._studio_fns[address_cs][name]
+
+    def _sign_and_send(self, tx_data: dict):
+        """Sign and broadcast a transaction.  Returns the pending tx hash."""
         signed = self._account.sign_transaction(tx_data)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        try:
+            return self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception:
+            # The local nonce may be stale (e.g. another process used the
+            # wallet); resync from chain before surfacing the error.
+            self._reset_nonce()
+            raise
+
+    def _wait_receipt(self, tx_hash) -> str:
+        """Wait for a receipt and check it succeeded.  Returns the hash hex."""
         receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
         if receipt["status"] != 1:
             raise RuntimeError(
@@ -77,15 +155,45 @@ class DirectSubmitter:
             )
         return tx_hash.hex()
 
+    def _send_tx(self, tx_data: dict) -> str:
+        """Sign, send, and wait for a transaction.  Returns the tx hash hex."""
+        return self._wait_receipt(self._sign_and_send(tx_data))
+
+    def _reset_nonce(self) -> None:
+        """Re-read the pending nonce from chain after a send failure."""
+        with self._tx_lock:
+            self._nonce = self.w3.eth.get_transaction_count(
+                self.wallet_address, "pending"
+            )
+        logger.info("direct_submitter.nonce_reset", nonce=self._nonce)
+
+    def _cached_gas_price(self) -> int:
+        """Return the node gas price, refreshed at most every few seconds."""
+        now = time.monotonic()
+        if now - self._gas_price_ts > _GAS_PRICE_TTL_SECONDS:
+            self._gas_price = self.w3.eth.gas_price
+            self._gas_price_ts = now
+        return self._gas_price
+
     def _build_tx(self, fn, value: int = 0) -> dict:
-        """Build a transaction dict from a contract function call."""
-        return fn.build_transaction({
-            "from": self._account.address,
-            "value": value,
-            "nonce": self.w3.eth.get_transaction_count(self._account.address),
-            "gas": 500_000,
-            "gasPrice": self.w3.eth.gas_price,
-        })
+        """Build a transaction dict from a contract function call.
+
+        Uses the locally-tracked nonce and cached gas price rather than
+        issuing two RPC round-trips per transaction.  The lock is held
+        across the whole build -- build_transaction may itself issue a
+        chainId RPC, and the nonce must not be handed to a second
+        thread inside that window.
+        """
+        with self._tx_lock:
+            tx = fn.build_transaction({
+                "from": self._account.address,
+                "value": value,
+                "nonce": self._nonce,
+                "gas": 500_000,
+                "gasPrice": self._cached_gas_price(),
+            })
+            self._nonce += 1
+        return tx
 
     # ------------------------------------------------------------------
     # Identity (no-op in local mode)
@@ -128,33 +236,50 @@ class DirectSubmitter:
         dict
             Result with ``state`` key for compatibility with SDK client.
         """
-        studio = self._studio_contract(studio_address)
+        # Blocking web3 calls run in a thread so the event loop stays free
+        # for other studios while we wait on RPC / tx inclusion.
+
+        is_registered = await asyncio.to_thread(
+            self._studio_fn(studio_address, "isWorkerRegistered")(
+                self._account.address
+            ).call
+        )
+        logger.info(
+            "direct_submitter.submit_work",
+            studio=studio_address,
+            outcome=outcome,
+            evidence_cid=evidence_cid,
+        )
+        work_fn = self._studio_fn(studio_address, "submitWork")(outcome, evidence_cid)
 
-        # 1. Register as worker if not already registered
-        if not studio.functions.isWorkerRegistered(self._account.address).call():
+        if not is_registered:
+            # Pipeline registration and submission: both txs carry
+            # consecutive local nonces, so they can be broadcast
+            # back-to-back and waiting on the receipts in parallel hides
+            # one block time.
             logger.info(
                 "direct_submitter.register_worker",
                 studio=studio_address,
                 stake=Web3.from_wei(WORKER_STAKE_WEI, "ether"),
             )
-            tx = self._build_tx(
-                studio.functions.registerAsWorker(),
-                value=WORKER_STAKE_WEI,
+            reg_tx = await asyncio.to_thread(
+                self._build_tx,
+                self._studio_fn(studio_address, "registerAsWorker")(),
+                WORKER_STAKE_WEI,
             )
-            tx_hash = self._send_tx(tx)
-            logger.info("direct_submitter.worker_registered", tx=tx_hash)
+            work_tx = await asyncio.to_thread(self._build_tx, work_fn)
+            reg_pending = await asyncio.to_thread(self._sign_and_send, reg_tx)
+            work_pending = await asyncio.to_thread(self._sign_and_send, work_tx)
+            reg_hash, tx_hash = await asyncio.gather(
+                asyncio.to_thread(self._wait_receipt, reg_pending),
+                asyncio.to_thread(self._wait_receipt, work_pending),
+            )
+            logger.info("direct_submitter.worker_registered", tx=reg_hash)
         else:
             logger.info("direct_submitter.worker_already_registered", studio=studio_address)
+            tx = await asyncio.to_thread(self._build_tx, work_fn)
+            tx_hash = await asyncio.to_thread(self._send_tx, tx)
 
-        # 2. Submit work
-        logger.info(
-            "direct_submitter.submit_work",
-            studio=studio_address,
-            outcome=outcome,
-            evidence_cid=evidence_cid,
-        )
-        tx = self._build_tx(studio.functions.submitWork(outcome, evidence_cid))
-        tx_hash = self._send_tx(tx)
         logger.info("direct_submitter.work_submitted", tx=tx_hash)
 
         return {"state": "completed", "tx": tx_hash}
@@ -186,23 +311,38 @@ class DirectSubmitter:
         dict
             Result with ``state`` key for compatibility with SDK client.
         """
-        studio = self._studio_contract(studio_address)
-
-        # 1. Register as verifier if not already registered
-        if not studio.functions.isVerifierRegistered(self._account.address).call():
-            logger.info(
-                "direct_submitter.register_verifier",
-                studio=studio_address,
-                stake=Web3.from_wei(VERIFIER_STAKE_WEI, "ether"),
-            )
-            tx = self._build_tx(
-                studio.functions.registerAsVerifier(),
-                value=VERIFIER_STAKE_WEI,
-            )
-            tx_hash = self._send_tx(tx)
-            logger.info("direct_submitter.verifier_registered", tx=tx_hash)
-        else:
-            logger.info("direct_submitter.verifier_already_registered", studio=studio_address)
+        # 1. Register as verifier if not already registered.  Held under
+        # a per-studio lock so concurrent submissions for the same studio
+        # register exactly once.
+        address_cs = Web3.to_checksum_address(studio_address)
+        if address_cs not in self._verifier_registered:
+            lock = self._verifier_reg_locks.setdefault(address_cs, asyncio.Lock())
+            async with lock:
+                if address_cs not in self._verifier_registered:
+                    is_registered = await asyncio.to_thread(
+                        self._studio_fn(studio_address, "isVerifierRegistered")(
+                            self._account.address
+                        ).call
+                    )
+                    if not is_registered:
+                        logger.info(
+                            "direct_submitter.register_verifier",
+                            studio=studio_address,
+                            stake=Web3.from_wei(VERIFIER_STAKE_WEI, "ether"),
+                        )
+                        tx = await asyncio.to_thread(
+                            self._build_tx,
+                            self._studio_fn(studio_address, "registerAsVerifier")(),
+                            VERIFIER_STAKE_WEI,
+                        )
+                        tx_hash = await asyncio.to_thread(self._send_tx, tx)
+                        logger.info("direct_submitter.verifier_registered", tx=tx_hash)
+                    else:
+                        logger.info(
+                            "direct_submitter.verifier_already_registered",
+                            studio=studio_address,
+                        )
+                    self._verifier_registered.add(address_cs)
 
         # 2. Submit scores
         logger.info(
@@ -211,13 +351,14 @@ class DirectSubmitter:
             worker=worker_address,
             scores=scores,
         )
-        tx = self._build_tx(
-            studio.functions.submitScores(
+        tx = await asyncio.to_thread(
+            self._build_tx,
+            self._studio_fn(studio_address, "submitScores")(
                 Web3.to_checksum_address(worker_address),
                 scores,
-            )
+            ),
         )
-        tx_hash = self._send_tx(tx)
+        tx_hash = await asyncio.to_thread(self._send_tx, tx)
         logger.info("direct_submitter.scores_submitted", tx=tx_hash)
 
         return {"state": "completed", "tx": tx_hash}
@@ -7,22 +7,44 @@ contracts and the central registry.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import requests
 import structlog
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.contract import Contract
 
 from shared.constants import (
     CHAOS_ORACLE_REGISTRY_ADDRESS,
     CHAOS_ORACLE_REGISTRY_ABI,
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
     PREDICTION_SETTLEMENT_LOGIC_ABI,
     SEPOLIA_RPC_URL,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Topic hash for PredictionSettlementLogic's ScoresSubmitted event, used to
+# build a local "already scored" index from logs instead of polling storage.
+_SCORES_SUBMITTED_TOPIC = Web3.keccak(text="ScoresSubmitted(address,address,uint8[4])")
+
+# Topics for incremental (event-driven) polling: new studios from the
+# registry and new worker submissions from studio proxies.
+_STUDIO_CREATED_TOPIC = Web3.keccak(
+    text="StudioCreated(bytes32,address,uint256,address,uint256)"
+)
+_WORK_SUBMITTED_TOPIC = Web3.keccak(text="WorkSubmitted(address,uint8,string)")
+
+# to_checksum_address keccak-hashes its input; addresses recur constantly in
+# the poll loops, so memoise the conversion.
+_to_checksum = lru_cache(maxsize=1024)(Web3.to_checksum_address)
+
 
 @dataclass(frozen=True)
 class StudioDetails:
@@ -56,19 +78,31 @@ class RegistryReader:
     registry_address:
         Deployed ChaosOracleRegistry address.  Defaults to the constant
         from :mod:`shared.constants`.
+    details_ttl_seconds:
+        How long cached :class:`StudioDetails` stay fresh.  Questions
+        and options are immutable on-chain, so a short TTL only delays
+        visibility of count/epoch changes by at most one poll.
     """
 
     def __init__(
         self,
         rpc_url: str | None = None,
         registry_address: str | None = None,
+        details_ttl_seconds: float = 30.0,
     ) -> None:
         self._rpc_url = rpc_url or SEPOLIA_RPC_URL
         self._registry_address = Web3.to_checksum_address(
             registry_address or CHAOS_ORACLE_REGISTRY_ADDRESS
         )
 
-        self.w3 = Web3(Web3.HTTPProvider(self._rpc_url))
+        # A pooled requests session keeps keep-alive connections to the RPC
+        # endpoint instead of re-handshaking per eth_call.
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
+        self.w3 = Web3(Web3.HTTPProvider(self._rpc_url, session=self._http))
         if not self.w3.is_connected():
             logger.warning("registry_reader.rpc_not_connected", rpc_url=self._rpc_url)
 
@@ -77,6 +111,29 @@ class RegistryReader:
             abi=CHAOS_ORACLE_REGISTRY_ABI,
         )
 
+        # Studio Contract objects keyed by checksum address.  Construction
+        # parses the ABI and builds bound functions, so cache per studio.
+        self._studio_contracts: dict[str, Contract] = {}
+
+        # Multicall3 aggregates many view calls into one eth_call.  If the
+        # connected chain lacks the deployment we fall back to plain calls.
+        self._multicall: Contract = self.w3.eth.contract(
+            address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI,
+        )
+        self._multicall_available: bool = True
+
+        # Local index of ScoresSubmitted events: (studio, verifier, worker)
+        # triples seen so far, plus the next block to scan per studio.
+        self._scored_pairs: set[tuple[str, str, str]] = set()
+        self._last_scored_block: dict[str, int] = {}
+
+        # TTL cache of studio details.  Closed-epoch entries are served
+        # forever (an epoch never reopens), so polling a settled studio
+        # costs zero RPCs.
+        self._details_ttl = details_ttl_seconds
+        self._details_cache: dict[str, tuple[float, StudioDetails]] = {}
+
         logger.info(
             "registry_reader.initialized",
             registry=self._registry_address,
@@ -88,22 +145,154 @@ class RegistryReader:
     # ------------------------------------------------------------------
 
     def _studio_contract(self, studio_address: str) -> Contract:
-        """Return a :class:`Contract` bound to a studio proxy."""
-        return self.w3.eth.contract(
-            address=Web3.to_checksum_address(studio_address),
-            abi=PREDICTION_SETTLEMENT_LOGIC_ABI,
-        )
+        """Return a :class:`Contract` bound to a studio proxy (cached)."""
+        address_cs = _to_checksum(studio_address)
+        contract = self._studio_contracts.get(address_cs)
+        if contract is None:
+            contract = self.w3.eth.contract(
+                address=address_cs,
+                abi=PREDICTION_SETTLEMENT_LOGIC_ABI,
+            )
+            self._studio_contracts[address_cs] = contract
+        return contract
+
+    def _batch_eth_call(self, calls: list[tuple[str, str]]) -> list[bytes]:
+        """Execute many ``eth_call`` requests in a single HTTP round-trip.
+
+        Standard JSON-RPC providers accept an array of request objects and
+        return an array of responses, so N contract reads cost one network
+        round-trip instead of N.
+
+        Parameters
+        ----------
+        calls:
+            ``(to_address, calldata_hex)`` pairs.
+
+        Returns
+        -------
+        list[bytes]
+            Raw return data for each call, in request order.
+        """
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": "eth_call",
+                "params": [{"to": to, "data": data}, "latest"],
+                "id": i,
+            }
+            for i, (to, data) in enumerate(calls)
+        ]
+        resp = self._http.post(self._rpc_url, json=payload, timeout=30)
+        resp.raise_for_status()
+        by_id = {item.get("id"): item for item in resp.json()}
+
+        results: list[bytes] = []
+        for i in range(len(calls)):
+            item = by_id.get(i)
+            if item is None or "error" in (item or {}):
+                raise RuntimeError(
+                    f"Batched eth_call {i} failed: "
+                    f"{item.get('error') if item else 'missing response'}"
+                )
+            results.append(bytes.fromhex(item["result"][2:]))
+        return results
+
+    def _aggregate3(self, calls: list[tuple[str, str]]) -> list[bytes]:
+        """Aggregate many view calls into one ``eth_call`` via Multicall3.
+
+        Parameters
+        ----------
+        calls:
+            ``(target_address, calldata_hex)`` pairs.
+
+        Returns
+        -------
+        list[bytes]
+            Raw return data for each sub-call, in order.
+
+        Raises
+        ------
+        RuntimeError
+            If any sub-call failed on-chain.
+        """
+        packed = [(target, False, bytes.fromhex(data[2:])) for target, data in calls]
+        returned = self._multicall.functions.aggregate3(packed).call()
+        results: list[bytes] = []
+        for i, (success, return_data) in enumerate(returned):
+            if not success:
+                raise RuntimeError(f"Multicall3 sub-call {i} reverted")
+            results.append(return_data)
+        return results
+
+    def _batched_calls(self, calls: list[tuple[str, str]]) -> list[bytes]:
+        """Execute many view calls with the cheapest available transport.
+
+        Prefers a single Multicall3 ``aggregate3`` (one eth_call for the
+        whole batch); falls back to a JSON-RPC request array on chains
+        without the deployment.
+        """
+        if self._multicall_available:
+            try:
+                return self._aggregate3(calls)
+            except Exception:
+                logger.warning("registry_reader.multicall_unavailable")
+                self._multicall_available = False
+        return self._batch_eth_call(calls)
+
+    def _cached_details(self, studio_address: str) -> StudioDetails | None:
+        """Return cached details if still fresh (or permanently settled)."""
+        cached = self._details_cache.get(studio_address)
+        if cached is None:
+            return None
+        fetched_at, details = cached
+        if details.epoch_closed or time.monotonic() - fetched_at < self._details_ttl:
+            return details
+        return None
+
+    def _refresh_scored_index(self, studio_cs: str) -> None:
+        """Pull new ``ScoresSubmitted`` logs for a studio into the local index.
+
+        One ``eth_getLogs`` query returns every score submitted since the
+        last scan, replacing per-worker ``verifierScores`` storage polling.
+        """
+        from_block = self._last_scored_block.get(studio_cs, 0)
+        latest = self.w3.eth.block_number
+        if latest < from_block:
+            return
+        logs = self.w3.eth.get_logs({
+            "address": studio_cs,
+            "fromBlock": from_block,
+            "toBlock": latest,
+            "topics": [_SCORES_SUBMITTED_TOPIC],
+        })
+        for log in logs:
+            verifier = _to_checksum(bytes(log["topics"][1])[-20:])
+            worker = _to_checksum(bytes(log["topics"][2])[-20:])
+            self._scored_pairs.add((studio_cs, verifier, worker))
+        self._last_scored_block[studio_cs] = latest + 1
 
     # ------------------------------------------------------------------
     # Registry reads
     # ------------------------------------------------------------------
 
-    def get_active_studios(self) -> list[str]:
-        """Return the list of currently active (unsettled) studio addresses."""
+    def get_active_studios(self, exclude: set[str] | None = None) -> list[str]:
+        """Return the list of currently active (unsettled) studio addresses.
+
+        Parameters
+        ----------
+        exclude:
+            Checksummed addresses to drop at the decode layer -- cheaper
+            than having callers rebuild a filtered list from the full
+            result every cycle.
+        """
         try:
             studios: list[str] = self._registry.functions.getActiveStudios().call()
             logger.info("registry_reader.active_studios", count=len(studios))
-            return [Web3.to_checksum_address(s) for s in studios]
+            if exclude:
+                return [
+                    cs for s in studios if (cs := _to_checksum(s)) not in exclude
+                ]
+            return [_to_checksum(s) for s in studios]
         except (ConnectionError, TimeoutError, OSError) as exc:
             logger.error("registry_reader.rpc_connection_error", error=str(exc))
             raise
@@ -111,11 +300,94 @@ class RegistryReader:
             logger.exception("registry_reader.get_active_studios.error")
             return []
 
+    def current_block(self) -> int:
+        """Return the current chain head block number."""
+        return self.w3.eth.block_number
+
+    def get_new_studios_since(self, from_block: int) -> tuple[list[str], int]:
+        """Return studios created since *from_block* and the next scan cursor.
+
+        One ``eth_getLogs`` over the registry's ``StudioCreated`` events
+        keeps per-cycle work proportional to *new* studios instead of
+        rescanning the whole active list every poll.
+
+        Parameters
+        ----------
+        from_block:
+            First block (inclusive) to scan.
+
+        Returns
+        -------
+        tuple[list[str], int]
+            Checksummed studio addresses and the ``from_block`` to use on
+            the next call.
+        """
+        latest = self.w3.eth.block_number
+        if latest < from_block:
+            return [], from_block
+        logs = self.w3.eth.get_logs({
+            "address": self._registry_address,
+            "fromBlock": from_block,
+            "toBlock": latest,
+            "topics": [_STUDIO_CREATED_TOPIC],
+        })
+        studios = [_to_checksum(bytes(log["topics"][2])[-20:]) for log in logs]
+        logger.info(
+            "registry_reader.new_studios",
+            count=len(studios),
+            from_block=from_block,
+            to_block=latest,
+        )
+        return studios, latest + 1
+
+    def get_new_submissions_since(
+        self,
+        from_block: int,
+    ) -> tuple[list[tuple[str, str]], int]:
+        """Return ``(studio, worker)`` pairs with new work since *from_block*.
+
+        Scans ``WorkSubmitted`` events across all studio proxies in one
+        ``eth_getLogs`` query (topic-filtered, no address filter, so new
+        studios are covered without maintaining an address list).
+
+        Parameters
+        ----------
+        from_block:
+            First block (inclusive) to scan.
+
+        Returns
+        -------
+        tuple[list[tuple[str, str]], int]
+            Checksummed ``(studio, worker)`` pairs and the next cursor.
+        """
+        latest = self.w3.eth.block_number
+        if latest < from_block:
+            return [], from_block
+        logs = self.w3.eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": latest,
+            "topics": [_WORK_SUBMITTED_TOPIC],
+        })
+        pairs = [
+            (
+                _to_checksum(log["address"]),
+                _to_checksum(bytes(log["topics"][1])[-20:]),
+            )
+            for log in logs
+        ]
+        logger.info(
+            "registry_reader.new_submissions",
+            count=len(pairs),
+            from_block=from_block,
+            to_block=latest,
+        )
+        return pairs, latest + 1
+
     def can_close_studio(self, studio_address: str) -> bool:
         """Check whether a studio has met the minimum thresholds to close."""
         try:
             return self._registry.functions.canCloseStudio(
-                Web3.to_checksum_address(studio_address),
+                _to_checksum(studio_address),
             ).call()
         except Exception:
             logger.exception(
@@ -141,14 +413,62 @@ class RegistryReader:
         StudioDetails
             Frozen dataclass with the studio's current on-chain state.
         """
+        cached = self._cached_details(studio_address)
+        if cached is not None:
+            return cached
+
         studio = self._studio_contract(studio_address)
 
-        question: str = studio.functions.question().call()
-        option_count: int = min(studio.functions.getOptionCount().call(), 20)
-        options = [studio.functions.getOption(i).call() for i in range(option_count)]
-        worker_count: int = studio.functions.getWorkerCount().call()
-        verifier_count: int = studio.functions.getVerifierCount().call()
-        epoch_closed: bool = studio.functions.epochClosed().call()
+        snapshot = None
+        if self._multicall_available:
+            try:
+                snapshot = self._aggregate3([
+                    (studio.address, studio.encode_abi("question")),
+                    (studio.address, studio.encode_abi("getOptionCount")),
+                    (studio.address, studio.encode_abi("getWorkerCount")),
+                    (studio.address, studio.encode_abi("getVerifierCount")),
+                    (studio.address, studio.encode_abi("epochClosed")),
+                ])
+            except Exception:
+                # Chain without a Multicall3 deployment (e.g. bare dev node);
+                # remember and use plain calls from now on.
+                logger.warning(
+                    "registry_reader.multicall_unavailable",
+                    studio=studio_address,
+                )
+                self._multicall_available = False
+
+        if snapshot is not None:
+            question: str = self.w3.codec.decode(["string"], snapshot[0])[0]
+            option_count: int = min(
+                self.w3.codec.decode(["uint256"], snapshot[1])[0], 20
+            )
+            worker_count: int = self.w3.codec.decode(["uint256"], snapshot[2])[0]
+            verifier_count: int = self.w3.codec.decode(["uint256"], snapshot[3])[0]
+            epoch_closed: bool = self.w3.codec.decode(["bool"], snapshot[4])[0]
+        else:
+            question = studio.functions.question().call()
+            option_count = min(studio.functions.getOptionCount().call(), 20)
+            worker_count = studio.functions.getWorkerCount().call()
+            verifier_count = studio.functions.getVerifierCount().call()
+            epoch_closed = studio.functions.epochClosed().call()
+
+        # Materialise the options with one aggregate instead of one
+        # round-trip per option.
+        options: list[str] = []
+        if option_count > 0:
+            if self._multicall_available:
+                option_raws = self._aggregate3([
+                    (studio.address, studio.encode_abi("getOption", args=[i]))
+                    for i in range(option_count)
+                ])
+                options = [
+                    self.w3.codec.decode(["string"], raw)[0] for raw in option_raws
+                ]
+            else:
+                options = [
+                    studio.functions.getOption(i).call() for i in range(option_count)
+                ]
 
         details = StudioDetails(
             address=studio_address,
@@ -158,6 +478,7 @@ class RegistryReader:
             verifier_count=verifier_count,
             epoch_closed=epoch_closed,
         )
+        self._details_cache[studio_address] = (time.monotonic(), details)
 
         logger.info(
             "registry_reader.studio_details",
@@ -170,6 +491,121 @@ class RegistryReader:
         )
         return details
 
+    def get_many_studio_details(
+        self,
+        studio_addresses: list[str],
+        refresh: set[str] | None = None,
+    ) -> dict[str, StudioDetails]:
+        """Fetch details for many studios in two aggregated ``eth_call``\\ s.
+
+        One Multicall3 aggregate covers every studio's state snapshot and
+        a second covers all option strings, so a poll cycle over N
+        studios costs two RPCs instead of 2N.  Falls back to sequential
+        :meth:`get_studio_details` on chains without Multicall3 (or for
+        a single studio, where aggregation buys nothing).
+
+        Parameters
+        ----------
+        studio_addresses:
+            StudioProxy contract addresses.
+        refresh:
+            Addresses whose cached details must be bypassed -- pass the
+            studios surfaced by an event scan, so a ``WorkSubmitted``
+            observed this cycle can never be masked by a TTL-fresh
+            snapshot with a stale ``worker_count``.  Permanently closed
+            entries are still served from cache (an epoch never
+            reopens).
+
+        Returns
+        -------
+        dict[str, StudioDetails]
+            Details keyed by the address as passed in.
+        """
+        details_map: dict[str, StudioDetails] = {}
+        to_fetch: list[str] = []
+        for address in studio_addresses:
+            cached = self._cached_details(address)
+            if cached is not None and refresh and address in refresh:
+                if not cached.epoch_closed:
+                    cached = None
+            if cached is not None:
+                details_map[address] = cached
+            else:
+                to_fetch.append(address)
+
+        if not to_fetch:
+            return details_map
+
+        if len(to_fetch) <= 1 or not self._multicall_available:
+            for address in to_fetch:
+                details_map[address] = self.get_studio_details(address)
+            return details_map
+
+        contracts = [self._studio_contract(a) for a in to_fetch]
+        snapshot_calls: list[tuple[str, str]] = []
+        for studio in contracts:
+            snapshot_calls.extend([
+                (studio.address, studio.encode_abi("question")),
+                (studio.address, studio.encode_abi("getOptionCount")),
+                (studio.address, studio.encode_abi("getWorkerCount")),
+                (studio.address, studio.encode_abi("getVerifierCount")),
+                (studio.address, studio.encode_abi("epochClosed")),
+            ])
+
+        decode = self.w3.codec.decode
+        try:
+            snapshot = self._aggregate3(snapshot_calls)
+            parsed = []
+            for i in range(len(contracts)):
+                base = i * 5
+                parsed.append((
+                    decode(["string"], snapshot[base])[0],
+                    min(decode(["uint256"], snapshot[base + 1])[0], 20),
+                    decode(["uint256"], snapshot[base + 2])[0],
+                    decode(["uint256"], snapshot[base + 3])[0],
+                    decode(["bool"], snapshot[base + 4])[0],
+                ))
+
+            # All option strings for all studios in one more aggregate.
+            option_calls: list[tuple[str, str]] = []
+            for studio, (_, option_count, _, _, _) in zip(contracts, parsed):
+                option_calls.extend(
+                    (studio.address, studio.encode_abi("getOption", args=[i]))
+                    for i in range(option_count)
+                )
+            option_raws = self._aggregate3(option_calls) if option_calls else []
+        except Exception:
+            logger.warning("registry_reader.multicall_unavailable")
+            self._multicall_available = False
+            for address in to_fetch:
+                details_map[address] = self.get_studio_details(address)
+            return details_map
+
+        cursor = 0
+        for address, fields in zip(to_fetch, parsed):
+            question, option_count, worker_count, verifier_count, epoch_closed = fields
+            options = [
+                decode(["string"], raw)[0]
+                for raw in option_raws[cursor:cursor + option_count]
+            ]
+            cursor += option_count
+            details = StudioDetails(
+                address=address,
+                question=question,
+                options=options,
+                worker_count=worker_count,
+                verifier_count=verifier_count,
+                epoch_closed=epoch_closed,
+            )
+            self._details_cache[address] = (time.monotonic(), details)
+            details_map[address] = details
+
+        logger.info(
+            "registry_reader.many_studio_details",
+            studios=len(details_map),
+        )
+        return details_map
+
     def get_unscored_submissions(
         self,
         studio_address: str,
@@ -192,44 +628,64 @@ class RegistryReader:
         list[WorkerSubmission]
             Submissions the verifier has not yet scored.
         """
-        studio = self._studio_contract(studio_address)
-        verifier_cs = Web3.to_checksum_address(verifier_address)
-
-        worker_count: int = studio.functions.getWorkerCount().call()
-        unscored: list[WorkerSubmission] = []
-
-        for i in range(worker_count):
-            worker: str = studio.functions.workerList(i).call()
-            worker_cs = Web3.to_checksum_address(worker)
-
-            # Fetch submission
-            outcome, evidence_cid, timestamp = studio.functions.submissions(worker_cs).call()
-            if timestamp == 0:
-                # Worker registered but hasn't submitted yet
-                continue
-
-            # Check if this verifier already scored this worker.
-            # The Solidity getter for mapping(addr => mapping(addr => uint8[4]))
-            # takes 3 args: (verifier, worker, index) and returns a single uint8.
-            try:
-                already_scored = any(
-                    studio.functions.verifierScores(verifier_cs, worker_cs, idx).call() > 0
-                    for idx in range(4)
-                )
-                if already_scored:
-                    continue
-            except Exception:
-                # Uninitialised mapping entries return 0; treat errors as "not scored".
-                pass
-
-            unscored.append(
-                WorkerSubmission(
-                    worker_address=worker_cs,
-                    outcome=outcome,
-                    evidence_cid=evidence_cid,
-                    timestamp=timestamp,
-                )
+        try:
+            studio = self._studio_contract(studio_address)
+            studio_cs = _to_checksum(studio_address)
+            verifier_cs = _to_checksum(verifier_address)
+
+            worker_count: int = studio.functions.getWorkerCount().call()
+            unscored: list[WorkerSubmission] = []
+
+            if worker_count > 0:
+                # One log scan replaces 4 verifierScores eth_calls per worker.
+                self._refresh_scored_index(studio_cs)
+
+                # Aggregate 1: the full worker list in one eth_call.
+                worker_calls = [
+                    (studio_cs, studio.encode_abi("workerList", args=[i]))
+                    for i in range(worker_count)
+                ]
+                workers = [
+                    _to_checksum(self.w3.codec.decode(["address"], raw)[0])
+                    for raw in self._batched_calls(worker_calls)
+                ]
+
+                # Aggregate 2: every worker's submission in a second eth_call.
+                submission_calls = [
+                    (studio_cs, studio.encode_abi("submissions", args=[worker_cs]))
+                    for worker_cs in workers
+                ]
+                raw_results = self._batched_calls(submission_calls)
+
+                for worker_cs, raw in zip(workers, raw_results):
+                    outcome, evidence_cid, timestamp = self.w3.codec.decode(
+                        ["uint8", "string", "uint256"], raw
+                    )
+                    if timestamp == 0:
+                        # Worker registered but hasn't submitted yet
+                        continue
+
+                    if (studio_cs, verifier_cs, worker_cs) in self._scored_pairs:
+                        continue
+
+                    unscored.append(
+                        WorkerSubmission(
+                            worker_address=worker_cs,
+                            outcome=outcome,
+                            evidence_cid=evidence_cid,
+                            timestamp=timestamp,
+                        )
+                    )
+
+        except (requests.RequestException, ConnectionError, TimeoutError, OSError) as exc:
+            # Network-level failures surface here once for the whole batch
+            # rather than per worker; let the caller decide on retry.
+            logger.error(
+                "registry_reader.unscored_submissions.rpc_error",
+                studio=studio_address,
+                error=str(exc),
             )
+            raise
 
         logger.info(
             "registry_reader.unscored_submissions",
@@ -239,3 +695,55 @@ class RegistryReader:
             unscored_count=len(unscored),
         )
         return unscored
+
+    # ------------------------------------------------------------------
+    # Async wrappers
+    # ------------------------------------------------------------------
+
+    async def aget_active_studios(
+        self, exclude: set[str] | None = None
+    ) -> list[str]:
+        """Async variant of :meth:`get_active_studios`.
+
+        Runs the blocking web3 call in a worker thread so the caller's
+        event loop keeps servicing other tasks.
+        """
+        return await asyncio.to_thread(self.get_active_studios, exclude)
+
+    async def aget_studio_details(self, studio_address: str) -> StudioDetails:
+        """Async variant of :meth:`get_studio_details`."""
+        return await asyncio.to_thread(self.get_studio_details, studio_address)
+
+    async def aget_many_studio_details(
+        self,
+        studio_addresses: list[str],
+        refresh: set[str] | None = None,
+    ) -> dict[str, StudioDetails]:
+        """Async variant of :meth:`get_many_studio_details`."""
+        return await asyncio.to_thread(
+            self.get_many_studio_details, studio_addresses, refresh
+        )
+
+    async def aget_unscored_submissions(
+        self,
+        studio_address: str,
+        verifier_address: str,
+    ) -> list[WorkerSubmission]:
+        """Async variant of :meth:`get_unscored_submissions`."""
+        return await asyncio.to_thread(
+            self.get_unscored_submissions, studio_address, verifier_address
+        )
+
+    async def acurrent_block(self) -> int:
+        """Async variant of :meth:`current_block`."""
+        return await asyncio.to_thread(self.current_block)
+
+    async def aget_new_studios_since(self, from_block: int) -> tuple[list[str], int]:
+        """Async variant of :meth:`get_new_studios_since`."""
+        return await asyncio.to_thread(self.get_new_studios_since, from_block)
+
+    async def aget_new_submissions_since(
+        self, from_block: int
+    ) -> tuple[list[tuple[str, str]], int]:
+        """Async variant of :meth:`get_new_submissions_since`."""
+        return await asyncio.to_thread(self.get_new_submissions_since, from_block)
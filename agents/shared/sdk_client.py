@@ -7,13 +7,19 @@ score submission (verifier flow) via the ChaosChain Gateway.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import os
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 from typing import TYPE_CHECKING
 
+import aiohttp
 import structlog
 
 if TYPE_CHECKING:
@@ -36,6 +42,32 @@ logger = structlog.get_logger(__name__)
 # on-chain identity registration transactions.
 _AGENT_ID_CACHE_PATH = Path("chaoschain_agent_ids.json")
 
+# Process-wide view of the agent-id cache file: parsed from disk once,
+# then served from memory.  The lock also serialises writers so two
+# clients registering concurrently can't clobber each other's entries.
+_agent_id_cache: dict[str, int] | None = None
+_agent_id_cache_lock = threading.Lock()
+
+# Workflow states that end a gateway wait.
+_WORKFLOW_TERMINAL_STATES = frozenset({"completed", "failed", "rejected"})
+
+
+@functools.lru_cache(maxsize=1)
+def _sdk_imports() -> SimpleNamespace:
+    """Import ``chaoschain_sdk`` once and hand out its names.
+
+    Keeps the heavy SDK import off module load (local mode never needs
+    it) while avoiding repeated ``sys.modules`` lookups from the inline
+    imports on every submit call.
+    """
+    from chaoschain_sdk import AgentRole, ChaosChainAgentSDK, X402PaymentManager
+
+    return SimpleNamespace(
+        AgentRole=AgentRole,
+        ChaosChainAgentSDK=ChaosChainAgentSDK,
+        X402PaymentManager=X402PaymentManager,
+    )
+
 
 class ChaosOracleSDKClient:
     """Wraps :class:`ChaosChainAgentSDK` with ChaosOracle-specific helpers.
@@ -54,6 +86,10 @@ class ChaosOracleSDKClient:
         Domain claim for the agent identity token URI.
     agent_role:
         ``AgentRole.WORKER`` or ``AgentRole.VERIFIER``.
+    use_push_notifications:
+        When ``True`` (default), await workflow completion via the
+        gateway's websocket event stream and only fall back to HTTP
+        polling if the endpoint is unavailable.
     """
 
     def __init__(
@@ -64,15 +100,12 @@ class ChaosOracleSDKClient:
         agent_name: str = "ChaosOracleAgent",
         agent_domain: str = "agent.chaosoracle.example.com",
         agent_role: AgentRole | None = None,
+        use_push_notifications: bool = True,
     ) -> None:
-        from chaoschain_sdk import (
-            AgentRole as _AgentRole,
-            ChaosChainAgentSDK,
-            X402PaymentManager,
-        )
+        _sdk = _sdk_imports()
 
         if agent_role is None:
-            agent_role = _AgentRole.WORKER
+            agent_role = _sdk.AgentRole.WORKER
 
         self._private_key = private_key
         self._network = network
@@ -80,7 +113,7 @@ class ChaosOracleSDKClient:
         self._agent_name = agent_name
         self._agent_domain = agent_domain
 
-        self.sdk = ChaosChainAgentSDK(
+        self.sdk = _sdk.ChaosChainAgentSDK(
             agent_name=agent_name,
             agent_domain=agent_domain,
             agent_role=agent_role,
@@ -90,7 +123,7 @@ class ChaosOracleSDKClient:
             gateway_url=gateway_url,
         )
 
-        self.payment_manager = X402PaymentManager(
+        self.payment_manager = _sdk.X402PaymentManager(
             private_key=private_key,
             network=network,
         )
@@ -100,6 +133,14 @@ class ChaosOracleSDKClient:
         self.agent_id: int | None = None
         self.wallet_address: str = self.sdk.wallet_manager.address
 
+        # Flipped off permanently if the gateway lacks the events endpoint.
+        self._use_push_notifications = use_push_notifications
+
+        # Studios this process has already registered (and staked) with.
+        # register_with_studio is an on-chain tx, so skip it once done.
+        self._registered_worker: set[str] = set()
+        self._registered_verifier: set[str] = set()
+
         logger.info(
             "sdk_client.initialized",
             wallet=self.wallet_address,
@@ -126,7 +167,7 @@ class ChaosOracleSDKClient:
         # 1. Check local cache first
         cached_id = self._load_cached_agent_id()
         if cached_id is not None:
-            logger.info("sdk_client.identity_cached", agent_id=cached_id)
+            logger.debug("sdk_client.identity_cached", agent_id=cached_id)
             self.agent_id = cached_id
             return cached_id
 
@@ -146,6 +187,114 @@ class ChaosOracleSDKClient:
         self.agent_id = agent_id
         return agent_id
 
+    # ------------------------------------------------------------------
+    # Gateway workflow wait
+    # ------------------------------------------------------------------
+
+    async def _await_workflow(self, workflow_id: str, timeout: float) -> dict[str, Any]:
+        """Wait for a gateway workflow to reach a terminal state.
+
+        Prefers a websocket subscription to the gateway's event stream (a
+        single push instead of N status round-trips); falls back to
+        exponential-backoff polling when the endpoint is missing or the
+        stream errors out.
+
+        Parameters
+        ----------
+        workflow_id:
+            Gateway workflow identifier.
+        timeout:
+            Maximum seconds to wait before returning the last-seen state.
+        """
+        if self._use_push_notifications:
+            try:
+                return await asyncio.wait_for(
+                    self._subscribe_workflow(workflow_id), timeout
+                )
+            except aiohttp.WSServerHandshakeError as exc:
+                if exc.status in (404, 405):
+                    # This gateway build has no events endpoint; poll from
+                    # now on without re-attempting the handshake.
+                    self._use_push_notifications = False
+                logger.warning(
+                    "sdk_client.push_handshake_failed",
+                    workflow_id=workflow_id,
+                    status=exc.status,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "sdk_client.workflow_timeout",
+                    workflow_id=workflow_id,
+                    timeout=timeout,
+                )
+                return await asyncio.to_thread(self._workflow_status, workflow_id)
+            except aiohttp.ClientError as exc:
+                logger.warning(
+                    "sdk_client.push_stream_error",
+                    workflow_id=workflow_id,
+                    error=str(exc),
+                )
+        return await self._poll_workflow(workflow_id, timeout)
+
+    async def _subscribe_workflow(self, workflow_id: str) -> dict[str, Any]:
+        """Await a workflow's terminal state via the gateway event stream.
+
+        Opens a websocket to ``/workflows/<id>/events`` and returns the
+        first event whose state is terminal.  If the stream closes before
+        one arrives, returns the current state from a single status call.
+        """
+        url = f"{self._gateway_url.rstrip('/')}/workflows/{workflow_id}/events"
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(url) as ws:
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        continue
+                    event: dict[str, Any] = json.loads(msg.data)
+                    if event.get("state") in _WORKFLOW_TERMINAL_STATES:
+                        return event
+        # Stream closed without a terminal event; take a snapshot.
+        return await asyncio.to_thread(self._workflow_status, workflow_id)
+
+    def _workflow_status(self, workflow_id: str) -> dict[str, Any]:
+        """Fetch a workflow's state with whichever API the SDK exposes.
+
+        Newer gateway SDK builds have a non-blocking ``get_workflow``
+        status call; older ones only document ``wait_for_completion``,
+        which blocks until the workflow is terminal.  Probing keeps both
+        working: with the fallback a "poll" degenerates into a single
+        blocking wait, which is still correct.
+        """
+        get_workflow = getattr(self.gateway, "get_workflow", None)
+        if get_workflow is not None:
+            return get_workflow(workflow_id)
+        return self.gateway.wait_for_completion(workflow_id)
+
+    async def _poll_workflow(self, workflow_id: str, timeout: float) -> dict[str, Any]:
+        """Poll the workflow status with exponential backoff.
+
+        Checks immediately, then backs off from 0.25s doubling up to 7s,
+        so fast workflows return without eating a fixed polling interval.
+        """
+        start = time.monotonic()
+        delay = 0.25
+        while True:
+            result: dict[str, Any] = await asyncio.to_thread(
+                self._workflow_status, workflow_id
+            )
+            state = result.get("state")
+            if state in _WORKFLOW_TERMINAL_STATES:
+                return result
+            if time.monotonic() - start > timeout:
+                logger.warning(
+                    "sdk_client.workflow_timeout",
+                    workflow_id=workflow_id,
+                    state=state,
+                    timeout=timeout,
+                )
+                return result
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 7.0)
+
     # ------------------------------------------------------------------
     # Worker flow
     # ------------------------------------------------------------------
@@ -179,22 +328,22 @@ class ChaosOracleSDKClient:
             evidence_cid=evidence_cid,
         )
 
-        # Register with studio as worker (includes staking)
-        from chaoschain_sdk import AgentRole
-
-        self.sdk.register_with_studio(
-            studio_address,
-            AgentRole.WORKER,
-            stake_amount=WORKER_STAKE_WEI,
-        )
-        logger.info("sdk_client.worker_registered", studio=studio_address)
-
-        # Build data hash for gateway submission
-        evidence_payload_str = json.dumps(
-            {"outcome": outcome, "evidence_cid": evidence_cid},
-            sort_keys=True,
+        # Register with studio as worker (includes staking); once per studio
+        if studio_address.lower() not in self._registered_worker:
+            self.sdk.register_with_studio(
+                studio_address,
+                _sdk_imports().AgentRole.WORKER,
+                stake_amount=WORKER_STAKE_WEI,
+            )
+            self._registered_worker.add(studio_address.lower())
+            logger.debug("sdk_client.worker_registered", studio=studio_address)
+
+        # Build data hash for gateway submission.  The f-string matches
+        # json.dumps(..., sort_keys=True) output for these two fields
+        # exactly, preserving hash compatibility without encoder overhead.
+        data_hash = self.sdk.w3.keccak(
+            text=f'{{"evidence_cid": "{evidence_cid}", "outcome": {outcome}}}'
         )
-        data_hash = self.sdk.w3.keccak(text=evidence_payload_str)
 
         workflow = self.sdk.submit_work_via_gateway(
             studio_address=studio_address,
@@ -205,7 +354,7 @@ class ChaosOracleSDKClient:
             signer_address=self.wallet_address,
         )
 
-        result = self.gateway.wait_for_completion(workflow["id"], timeout=120)
+        result = await self._await_workflow(workflow["id"], timeout=120)
         logger.info(
             "sdk_client.submit_work.done",
             studio=studio_address,
@@ -240,40 +389,44 @@ class ChaosOracleSDKClient:
         dict
             Gateway workflow result.
         """
+        worker_address_lc = worker_address.lower()
+
         logger.info(
             "sdk_client.submit_scores.start",
             studio=studio_address,
-            worker=worker_address,
+            worker=worker_address_lc,
             scores=scores,
         )
 
-        # Register with studio as verifier (includes staking)
-        from chaoschain_sdk import AgentRole
-
-        self.sdk.register_with_studio(
-            studio_address,
-            AgentRole.VERIFIER,
-            stake_amount=VERIFIER_STAKE_WEI,
-        )
-        logger.info("sdk_client.verifier_registered", studio=studio_address)
-
-        # Build data hash referencing the worker submission
-        data_hash = self.sdk.w3.keccak(text=worker_address.lower())
+        # Register with studio as verifier (includes staking); once per studio
+        if studio_address.lower() not in self._registered_verifier:
+            self.sdk.register_with_studio(
+                studio_address,
+                _sdk_imports().AgentRole.VERIFIER,
+                stake_amount=VERIFIER_STAKE_WEI,
+            )
+            self._registered_verifier.add(studio_address.lower())
+            logger.debug("sdk_client.verifier_registered", studio=studio_address)
+
+        # Build data hash referencing the worker submission.  The same
+        # lowercased form feeds the hash, the gateway call, and the logs
+        # so the three can never disagree on casing.
+        data_hash = self.sdk.w3.keccak(text=worker_address_lc)
 
         score_workflow = self.sdk.submit_score_via_gateway(
             studio_address=studio_address,
             epoch=1,
             data_hash=data_hash,
-            worker_address=worker_address,
+            worker_address=worker_address_lc,
             scores=scores,
             signer_address=self.wallet_address,
         )
 
-        result = self.gateway.wait_for_completion(score_workflow["id"], timeout=180)
+        result = await self._await_workflow(score_workflow["id"], timeout=180)
         logger.info(
             "sdk_client.submit_scores.done",
             studio=studio_address,
-            worker=worker_address,
+            worker=worker_address_lc,
             state=result.get("state"),
         )
         return result
@@ -284,24 +437,28 @@ class ChaosOracleSDKClient:
 
     def _load_cached_agent_id(self) -> int | None:
         """Return the cached agent ID for this wallet, or ``None``."""
-        if not _AGENT_ID_CACHE_PATH.exists():
-            return None
-        try:
-            data: dict[str, int] = json.loads(_AGENT_ID_CACHE_PATH.read_text())
-            return data.get(self.wallet_address)
-        except (json.JSONDecodeError, OSError):
-            return None
+        global _agent_id_cache
+        with _agent_id_cache_lock:
+            if _agent_id_cache is None:
+                _agent_id_cache = {}
+                try:
+                    _agent_id_cache = json.loads(_AGENT_ID_CACHE_PATH.read_text())
+                except (FileNotFoundError, json.JSONDecodeError, OSError):
+                    pass
+            return _agent_id_cache.get(self.wallet_address)
 
     def _save_cached_agent_id(self, agent_id: int) -> None:
-        """Persist ``agent_id`` keyed by wallet address."""
-        data: dict[str, int] = {}
-        if _AGENT_ID_CACHE_PATH.exists():
-            try:
-                data = json.loads(_AGENT_ID_CACHE_PATH.read_text())
-            except (json.JSONDecodeError, OSError):
-                pass
-        data[self.wallet_address] = agent_id
-        _AGENT_ID_CACHE_PATH.write_text(json.dumps(data, indent=2))
+        """Persist ``agent_id`` keyed by wallet address (atomic write)."""
+        global _agent_id_cache
+        with _agent_id_cache_lock:
+            if _agent_id_cache is None:
+                _agent_id_cache = {}
+            _agent_id_cache[self.wallet_address] = agent_id
+            # Write-then-rename so a crash mid-write never truncates the
+            # cache other agents may be reading.
+            tmp_path = _AGENT_ID_CACHE_PATH.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(_agent_id_cache, separators=(",", ":")))
+            os.replace(tmp_path, _AGENT_ID_CACHE_PATH)
         logger.debug("sdk_client.agent_id_cached", path=str(_AGENT_ID_CACHE_PATH))
 
 
@@ -0,0 +1,98 @@
+"""
+SQLite-backed progress store for ChaosOracle agents.
+
+Both agents track their progress in memory (``scored_pairs`` for the
+verifier, ``participated_studios`` for the worker), which means a restart
+forgets everything and re-runs every audit and research pass -- costly
+OpenAI calls plus on-chain transactions that will simply revert.
+Persisting the sets makes restarts near-free: the loop reloads them once
+at startup and records each success as it happens.
+
+SQLite is used over an append-only file because primary keys give free
+dedup and the database stays compact without log compaction.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scored (
+    studio TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    PRIMARY KEY (studio, worker)
+);
+CREATE TABLE IF NOT EXISTS participated (
+    studio TEXT NOT NULL PRIMARY KEY
+);
+"""
+
+
+class StateStore:
+    """Durable record of work the agent has already completed.
+
+    Parameters
+    ----------
+    db_path:
+        Path to the SQLite database file.  Created (with schema) on
+        first use.  ``":memory:"`` works for tests/ephemeral runs.
+
+    Notes
+    -----
+    Writes run in WAL mode with ``synchronous=NORMAL``: a commit only
+    waits for the write-ahead log, which is plenty durable for progress
+    tracking (worst case after a crash is redoing the last item) and
+    keeps the per-submission write off the poll loop's critical path.
+    The connection is used from one event loop thread only, matching how
+    the agents call it.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._conn = sqlite3.connect(db_path)
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.commit()
+        logger.info("state_store.opened", path=db_path)
+
+    # ------------------------------------------------------------------
+    # Loading (startup)
+    # ------------------------------------------------------------------
+
+    def load_scored(self) -> set[tuple[str, str]]:
+        """Return all persisted ``(studio, worker)`` scored pairs."""
+        rows = self._conn.execute("SELECT studio, worker FROM scored").fetchall()
+        return {(studio, worker) for studio, worker in rows}
+
+    def load_participated(self) -> set[str]:
+        """Return all persisted participated-studio addresses."""
+        rows = self._conn.execute("SELECT studio FROM participated").fetchall()
+        return {studio for (studio,) in rows}
+
+    # ------------------------------------------------------------------
+    # Recording (per successful submission)
+    # ------------------------------------------------------------------
+
+    def add_scored(self, studio: str, worker: str) -> None:
+        """Record one scored ``(studio, worker)`` pair.  Idempotent."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO scored (studio, worker) VALUES (?, ?)",
+            (studio, worker),
+        )
+        self._conn.commit()
+
+    def add_participated(self, studio: str) -> None:
+        """Record one participated studio address.  Idempotent."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO participated (studio) VALUES (?)",
+            (studio,),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
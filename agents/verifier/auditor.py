@@ -17,14 +17,73 @@ contract interface:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
+import json
+import random
 from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 import structlog
 
+# orjson decodes the response envelope and the embedded JSON content
+# several times faster than stdlib json.  Fall back to stdlib so local
+# dev environments without the extension keep working.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = structlog.get_logger(__name__)
 
 
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON using the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Maximum evidence packages folded into a single LLM request.  Keeps the
+# combined prompt comfortably inside the model context window.
+_MAX_AUDIT_BATCH = 8
+
+# Retry policy for transient LLM API failures.
+_RETRY_ATTEMPTS = 3
+_RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Static audit instructions, built once instead of per LLM call.
+_SYSTEM_PROMPT = (
+    "You are an expert auditor for a prediction market settlement protocol. "
+    "Evaluate each of the following worker submissions and score it on "
+    "four dimensions. Respond ONLY with valid JSON matching this schema, "
+    "with one result object per submission, in the same order:\n"
+    "{\n"
+    '  "results": [\n'
+    "    {\n"
+    '      "accuracy": <int 0-100>,\n'
+    '      "evidence_quality": <int 0-100>,\n'
+    '      "source_diversity": <int 0-100>,\n'
+    '      "reasoning_depth": <int 0-100>\n'
+    "    }\n"
+    "  ]\n"
+    "}\n\n"
+    "Scoring guide:\n"
+    "- accuracy: How likely is the chosen outcome correct given the evidence?\n"
+    "- evidence_quality: Are sources credible, relevant, and properly cited?\n"
+    "- source_diversity: Are multiple independent sources from different domains used?\n"
+    "- reasoning_depth: Is the reasoning chain thorough, logical, and well-structured?"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_options(options: tuple[str, ...]) -> str:
+    """Render the numbered options block; memoised since one market's
+    options are identical across every audited submission."""
+    return "\n".join(f"  {i}: {opt}" for i, opt in enumerate(options))
+
+
 class Auditor:
     """Audits worker evidence packages and produces score vectors.
 
@@ -34,22 +93,74 @@ class Auditor:
         API key for OpenAI (or compatible) LLM service.
     openai_model:
         Model identifier (e.g. ``gpt-4o``).
+    shard_count:
+        Number of HTTP sessions to spread LLM calls across.  Each shard
+        owns its own sockets, so concurrent audits are not serialised
+        onto a single connection.  Keep below the OpenAI org's
+        concurrent-request limit.
+    audit_timeout:
+        Seconds to wait for one LLM audit call before falling back to
+        the heuristic scorer.  Bounds verifier tail latency when the
+        LLM API is slow.
     """
 
     def __init__(
         self,
         openai_api_key: str = "",
         openai_model: str = "gpt-4o",
+        shard_count: int = 4,
+        audit_timeout: float = 20.0,
     ) -> None:
         self._api_key = openai_api_key
         self._model = openai_model
+        self._audit_timeout = audit_timeout
+        self._shard_count = max(1, shard_count)
+        self._sessions: list[aiohttp.ClientSession] = []
+        self._next_shard = itertools.cycle(range(self._shard_count))
 
         logger.info(
             "auditor.initialized",
             has_api_key=bool(openai_api_key),
             model=openai_model,
+            shards=self._shard_count,
         )
 
+    # ------------------------------------------------------------------
+    # Session management
+    # ------------------------------------------------------------------
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the next HTTP session in round-robin order, creating lazily.
+
+        Keep-alive sessions amortise the TLS handshake to the LLM API
+        across the verifier's entire audit loop; round-robin sharding
+        keeps concurrent audits on distinct sockets instead of queueing
+        behind one connection.
+        """
+        if not self._sessions:
+            self._sessions = [
+                aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=8,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=75,
+                    ),
+                    # Fail fast on network stalls: the per-audit budget is
+                    # enforced by audit_timeout, so don't let a single
+                    # connect or read hang anywhere near that long.
+                    timeout=aiohttp.ClientTimeout(total=60, connect=5, sock_read=15),
+                )
+                for _ in range(self._shard_count)
+            ]
+        return self._sessions[next(self._next_shard)]
+
+    async def aclose(self) -> None:
+        """Close all HTTP sessions.  Call from the agent shutdown hook."""
+        for session in self._sessions:
+            if not session.closed:
+                await session.close()
+        self._sessions = []
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -77,28 +188,76 @@ class Auditor:
             Four scores ``[accuracy, evidence_quality, source_diversity,
             reasoning_depth]``, each in the range 0-100.
         """
+        results = await self.audit_many([evidence_package], question, options)
+        return results[0]
+
+    async def audit_many(
+        self,
+        evidence_packages: list[dict[str, Any]],
+        question: str,
+        options: list[str],
+    ) -> list[list[int]]:
+        """Audit several evidence packages for one market in bulk.
+
+        Packages are folded into a single LLM request (in chunks of
+        :data:`_MAX_AUDIT_BATCH`), so a poll cycle that surfaces N new
+        submissions costs ``ceil(N / 8)`` API round-trips instead of N.
+
+        Parameters
+        ----------
+        evidence_packages:
+            Evidence packages fetched from Arweave, all for *question*.
+        question:
+            The prediction market question text.
+        options:
+            List of possible outcome strings.
+
+        Returns
+        -------
+        list[list[int]]
+            One four-score vector per package, in input order.
+        """
         logger.info(
             "auditor.audit.start",
             question=question[:120],
-            worker_outcome=evidence_package.get("outcome"),
+            submissions=len(evidence_packages),
         )
 
+        all_scores: list[list[int]] = []
         if self._api_key:
-            scores = await self._llm_audit(evidence_package, question, options)
+            for start in range(0, len(evidence_packages), _MAX_AUDIT_BATCH):
+                batch = evidence_packages[start:start + _MAX_AUDIT_BATCH]
+                try:
+                    all_scores.extend(
+                        await asyncio.wait_for(
+                            self._llm_audit(batch, question, options),
+                            timeout=self._audit_timeout,
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    # Don't stall the poll loop on a hung LLM call.
+                    logger.warning(
+                        "auditor.llm_timeout",
+                        timeout=self._audit_timeout,
+                        submissions=len(batch),
+                    )
+                    all_scores.extend(self._heuristic_audit(pkg) for pkg in batch)
         else:
-            scores = self._heuristic_audit(evidence_package)
+            all_scores = [
+                self._heuristic_audit(pkg) for pkg in evidence_packages
+            ]
 
         # Clamp all scores to [0, 100]
-        scores = [max(0, min(100, s)) for s in scores]
+        all_scores = [
+            [max(0, min(100, s)) for s in scores] for scores in all_scores
+        ]
 
         logger.info(
             "auditor.audit.done",
-            accuracy=scores[0],
-            evidence_quality=scores[1],
-            source_diversity=scores[2],
-            reasoning_depth=scores[3],
+            submissions=len(all_scores),
+            scores=all_scores,
         )
-        return scores
+        return all_scores
 
     # ------------------------------------------------------------------
     # Heuristic fallback (no LLM)
@@ -122,18 +281,20 @@ class Auditor:
         # Accuracy: scale from confidence (very rough proxy)
         accuracy = int(confidence * 100)
 
+        # One pass over sources gathers snippet lengths and unique domains.
+        total_snippet_len = 0
+        domains: set[str] = set()
+        for s in sources:
+            total_snippet_len += len(s.get("snippet", ""))
+            netloc = urlsplit(s.get("url", "")).netloc
+            if netloc:
+                domains.add(netloc)
+
         # Evidence quality: more sources with longer snippets = higher
-        snippet_lengths = [len(s.get("snippet", "")) for s in sources]
-        avg_snippet = sum(snippet_lengths) / max(len(snippet_lengths), 1)
+        avg_snippet = total_snippet_len / max(len(sources), 1)
         evidence_quality = min(100, int(len(sources) * 15 + avg_snippet / 5))
 
         # Source diversity: count unique domains
-        domains: set[str] = set()
-        for s in sources:
-            url = s.get("url", "")
-            if "://" in url:
-                domain = url.split("://", 1)[1].split("/", 1)[0]
-                domains.add(domain)
         source_diversity = min(100, len(domains) * 25)
 
         # Reasoning depth: length of reasoning text
@@ -147,56 +308,41 @@ class Auditor:
 
     async def _llm_audit(
         self,
-        evidence_package: dict[str, Any],
+        evidence_packages: list[dict[str, Any]],
         question: str,
         options: list[str],
-    ) -> list[int]:
-        """Use an LLM to evaluate the evidence package quality.
+    ) -> list[list[int]]:
+        """Use an LLM to evaluate a batch of evidence packages.
 
-        Sends the evidence package to the LLM and requests structured
-        JSON scores.
+        Sends all packages in one request and asks for a JSON array of
+        structured score objects, one per submission.
 
         Returns
         -------
-        list[int]
-            ``[accuracy, evidence_quality, source_diversity, reasoning_depth]``
+        list[list[int]]
+            ``[accuracy, evidence_quality, source_diversity,
+            reasoning_depth]`` per package, in input order.
         """
-        options_text = "\n".join(f"  {i}: {opt}" for i, opt in enumerate(options))
-
-        sources_text = "\n".join(
-            f"  - [{s.get('title', 'N/A')}]({s.get('url', '')}): {s.get('snippet', '')}"
-            for s in evidence_package.get("sources", [])
-        )
-
-        chosen_outcome = evidence_package.get("outcome", "?")
-        confidence = evidence_package.get("confidence", "?")
-        reasoning = evidence_package.get("reasoning", "(none)")
-
-        system_prompt = (
-            "You are an expert auditor for a prediction market settlement protocol. "
-            "Evaluate the following worker submission and score it on four dimensions. "
-            "Respond ONLY with valid JSON matching this schema:\n"
-            "{\n"
-            '  "accuracy": <int 0-100>,\n'
-            '  "evidence_quality": <int 0-100>,\n'
-            '  "source_diversity": <int 0-100>,\n'
-            '  "reasoning_depth": <int 0-100>\n'
-            "}\n\n"
-            "Scoring guide:\n"
-            "- accuracy: How likely is the chosen outcome correct given the evidence?\n"
-            "- evidence_quality: Are sources credible, relevant, and properly cited?\n"
-            "- source_diversity: Are multiple independent sources from different domains used?\n"
-            "- reasoning_depth: Is the reasoning chain thorough, logical, and well-structured?"
-        )
+        options_text = _format_options(tuple(options))
+
+        submission_blocks: list[str] = []
+        for idx, pkg in enumerate(evidence_packages):
+            sources_text = "\n".join(
+                f"  - [{s.get('title', 'N/A')}]({s.get('url', '')}): {s.get('snippet', '')}"
+                for s in pkg.get("sources", [])
+            )
+            submission_blocks.append(
+                f"[{idx}] Worker chose outcome: {pkg.get('outcome', '?')} "
+                f"(confidence: {pkg.get('confidence', '?')})\n"
+                f"Sources provided:\n{sources_text}\n"
+                f"Reasoning:\n{pkg.get('reasoning', '(none)')}"
+            )
 
         user_prompt = (
             f"Market Question: {question}\n\n"
             f"Options:\n{options_text}\n\n"
-            f"Worker chose outcome: {chosen_outcome} "
-            f"(confidence: {confidence})\n\n"
-            f"Sources provided:\n{sources_text}\n\n"
-            f"Reasoning:\n{reasoning}\n\n"
-            "Please evaluate and score this submission."
+            "Submissions:\n" + "\n\n".join(submission_blocks) + "\n\n"
+            "Please evaluate and score each submission."
         )
 
         headers = {
@@ -206,7 +352,7 @@ class Auditor:
         payload = {
             "model": self._model,
             "messages": [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
             ],
             "temperature": 1,
@@ -214,29 +360,54 @@ class Auditor:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await self._get_session()
+            for attempt in range(_RETRY_ATTEMPTS):
                 async with session.post(
                     "https://api.openai.com/v1/chat/completions",
                     json=payload,
                     headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=60),
                 ) as resp:
+                    if (
+                        resp.status in _RETRYABLE_STATUSES
+                        and attempt < _RETRY_ATTEMPTS - 1
+                    ):
+                        # Transient rate-limit / upstream blip: back off
+                        # briefly instead of silently degrading to the
+                        # heuristic scorer.
+                        try:
+                            delay = float(resp.headers.get("Retry-After", ""))
+                        except ValueError:
+                            delay = min(0.5 * 2**attempt + random.random() * 0.25, 8.0)
+                        logger.warning(
+                            "auditor.openai.retry",
+                            status=resp.status,
+                            attempt=attempt + 1,
+                            delay=round(delay, 2),
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+
                     if resp.status != 200:
                         body = await resp.text()
                         logger.error("auditor.openai.error", status=resp.status, body=body[:500])
                         raise RuntimeError(f"OpenAI API error: {resp.status}")
 
-                    data = await resp.json()
+                    data = _loads(await resp.read())
                     content = data["choices"][0]["message"]["content"]
+                    result = _loads(content)
 
-                    import json
-                    result = json.loads(content)
-
+                    results = result.get("results", [])
                     scores = [
-                        int(result.get("accuracy", 50)),
-                        int(result.get("evidence_quality", 50)),
-                        int(result.get("source_diversity", 50)),
-                        int(result.get("reasoning_depth", 50)),
+                        [
+                            int(entry.get("accuracy", 50)),
+                            int(entry.get("evidence_quality", 50)),
+                            int(entry.get("source_diversity", 50)),
+                            int(entry.get("reasoning_depth", 50)),
+                        ]
+                        # Pad with empty entries if the model returned too few.
+                        for entry in (
+                            results + [{}] * (len(evidence_packages) - len(results))
+                        )[: len(evidence_packages)]
                     ]
 
                     logger.info("auditor.openai.success", scores=scores)
@@ -245,4 +416,4 @@ class Auditor:
         except Exception:
             logger.exception("auditor.openai.call_failed")
             # Graceful fallback to heuristic
-            return self._heuristic_audit(evidence_package)
+            return [self._heuristic_audit(pkg) for pkg in evidence_packages]
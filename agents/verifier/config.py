@@ -7,6 +7,8 @@ defaults targeting Ethereum Sepolia.
 
 from __future__ import annotations
 
+import functools
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -68,6 +70,46 @@ class VerifierConfig(BaseSettings):
         ge=5,
         description="Seconds between registry poll cycles.",
     )
+    fast_poll_interval_seconds: float = Field(
+        default=1.0,
+        ge=0.1,
+        description="Shortened poll delay after a cycle that processed work.",
+    )
+    max_backoff_seconds: float = Field(
+        default=300.0,
+        ge=5.0,
+        description="Ceiling for exponential backoff after consecutive failed cycles.",
+    )
+
+    # ---- Concurrency ----
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum submissions audited concurrently per poll cycle.",
+    )
+    openai_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum in-flight OpenAI audit calls across all submissions.",
+    )
+    arweave_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum in-flight Arweave evidence fetches.",
+    )
+
+    # ---- Dedup sizing ----
+    bloom_expected_items: int = Field(
+        default=100_000,
+        ge=1,
+        description="Sizing target for the scored-pair Bloom prefilter.",
+    )
+
+    # ---- State persistence ----
+    state_db_path: str = Field(
+        default="verifier_state.db",
+        description="SQLite file persisting scored (studio, worker) pairs across restarts.",
+    )
 
     # ---- Staking ----
     verifier_stake: int = Field(
@@ -80,3 +122,14 @@ class VerifierConfig(BaseSettings):
         default="0x0000000000000000000000000000000000000000",
         description="Deployed ChaosOracleRegistry address on Sepolia.",
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_verifier_config() -> VerifierConfig:
+    """Return the process-wide :class:`VerifierConfig` singleton.
+
+    Constructing ``VerifierConfig()`` re-reads ``.env`` and re-runs
+    pydantic validation; use this accessor so that happens once per
+    process.
+    """
+    return VerifierConfig()  # type: ignore[call-arg]
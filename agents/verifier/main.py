@@ -13,32 +13,56 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import logging
 import signal
 import sys
 from typing import NoReturn
 
+import aiohttp
 import structlog
 
+# orjson encodes the log event dicts in native code; every log line
+# goes through the renderer, so this is a blanket 3-5x on the encode.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from shared.arweave_client import ArweaveClient
+from shared.bloom import BloomFilter
 from shared.registry_reader import RegistryReader
 from shared.sdk_client import create_sdk_client
+from shared.state_store import StateStore
 from verifier.auditor import Auditor
-from verifier.config import VerifierConfig
+from verifier.config import VerifierConfig, get_verifier_config
 
 # ---------------------------------------------------------------------------
 # Logging setup
 # ---------------------------------------------------------------------------
 
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """JSON renderer backed by orjson when the extension is available."""
+    if orjson is None:
+        return structlog.processors.JSONRenderer()
+    return structlog.processors.JSONRenderer(
+        serializer=lambda obj, **_kw: orjson.dumps(obj, default=str).decode()
+    )
+
+
+# Server-oriented config: no stack capture on ordinary log calls (walking
+# the stack on every info() in the per-submission loop is pure overhead --
+# ``logger.exception`` still attaches tracebacks) and JSON output instead
+# of the dev console renderer.  Filtering at INFO skips debug call sites
+# before any processor runs.
 structlog.configure(
     processors=[
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.set_exc_info,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(),
+        structlog.processors.format_exc_info,
+        _json_renderer(),
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(0),
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     context_class=dict,
     logger_factory=structlog.PrintLoggerFactory(),
     cache_logger_on_first_use=True,
@@ -51,21 +75,29 @@ logger = structlog.get_logger("verifier.main")
 # ---------------------------------------------------------------------------
 
 
+# name -> NetworkConfig, built once on first gateway-mode resolution.
+# Lazy because chaoschain_sdk is only installed in gateway mode.
+_NETWORK_MAP: dict[str, object] | None = None
+
+
 def _resolve_network(name: str):
     """Map a config string to a :class:`NetworkConfig` value.
 
     Only imported when running in gateway mode (requires chaoschain_sdk).
     """
+    global _NETWORK_MAP
+
     from chaoschain_sdk import NetworkConfig
 
-    _map: dict[str, NetworkConfig] = {
-        "ethereum_sepolia": NetworkConfig.ETHEREUM_SEPOLIA,
-    }
-    try:
-        return _map[name.lower()]
-    except KeyError:
+    if _NETWORK_MAP is None:
+        _NETWORK_MAP = {
+            "ethereum_sepolia": NetworkConfig.ETHEREUM_SEPOLIA,
+        }
+    network = _NETWORK_MAP.get(name.lower())
+    if network is None:
         logger.warning("verifier.unknown_network", name=name, fallback="ETHEREUM_SEPOLIA")
         return NetworkConfig.ETHEREUM_SEPOLIA
+    return network
 
 
 # ---------------------------------------------------------------------------
@@ -118,98 +150,350 @@ async def run(config: VerifierConfig) -> NoReturn:
         openai_model=config.openai_model,
     )
 
-    arweave = ArweaveClient()
+    # One keep-alive HTTP pool shared across aiohttp-based components so
+    # warm iterations skip DNS + TCP + TLS setup.  The registry reader
+    # keeps its own pooled requests.Session (web3's HTTPProvider is
+    # synchronous); the auditor keeps its sharded sessions for OpenAI.
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        ),
+    )
+
+    arweave = ArweaveClient(session=http_session)
+
+    state_store = StateStore(config.state_db_path)
 
     # -- Identity registration -----------------------------------------------
-    agent_id = await sdk_client.auto_register()
+    # Identity registration (an on-chain tx in gateway mode) and the first
+    # registry scan are independent, so overlap them and hand the scan
+    # result to the first poll iteration.
+    async def _initial_scan() -> list[str] | None:
+        try:
+            return await registry.aget_active_studios()
+        except Exception:
+            logger.exception("verifier.initial_scan_failed")
+            return None
+
+    agent_id, studios = await asyncio.gather(
+        sdk_client.auto_register(),
+        _initial_scan(),
+    )
     logger.info("verifier.identity_ready", agent_id=agent_id, wallet=sdk_client.wallet_address)
 
     # -- State ---------------------------------------------------------------
     # Tracks (studio_address, worker_address) pairs we have already scored.
-    scored_pairs: set[tuple[str, str]] = set()
+    # Reloaded from disk so a restart doesn't re-audit submissions and
+    # submit score transactions that would only revert.
+    scored_pairs: set[tuple[str, str]] = state_store.load_scored()
+
+    # Bloom prefilter in front of the exact set: "definitely new" pairs
+    # skip the big-set probe; a "maybe" still falls through to the exact
+    # check, since a Bloom false positive must never skip real work.
+    scored_bloom = BloomFilter(config.bloom_expected_items)
+    for _pair in scored_pairs:
+        scored_bloom.add("|".join(_pair))
 
     # Studios where we have already registered as a verifier.
     registered_studios: set[str] = set()
 
-    # -- Poll loop -----------------------------------------------------------
-    logger.info("verifier.loop.start", poll_interval=config.poll_interval_seconds)
+    # Incremental scan state: studios discovered so far, plus the next
+    # block to pull StudioCreated / WorkSubmitted events from.  ``None``
+    # forces a full registry scan (startup, or resync after an errored
+    # cycle).
+    active_studios: set[str] = set()
+    next_block: int | None = None
+
+    # Studios where an audit or score submission failed transiently.
+    # The steady-state delta scan only revisits studios with *new*
+    # events, so failures are carried here and re-checked every cycle
+    # until they drain -- otherwise a studio whose work failed once
+    # would sit unscored until the next full resync.
+    retry_studios: set[str] = set()
+
+    # -- Audit pipeline -------------------------------------------------------
+    # Each (studio, submission) audit is independent I/O (Arweave fetch,
+    # LLM call, on-chain submit); the semaphore bounds fan-out so a busy
+    # cycle can't saturate the RPC or LLM endpoints.
+    audit_semaphore = asyncio.Semaphore(config.max_concurrency)
+
+    # Provider-specific bound: unconstrained fan-out would fire every
+    # OpenAI call at once, trip 429s, and end up slower than sequential
+    # once backoff kicks in.  Caps in-flight LLM calls independently of
+    # the wider audit pipeline.
+    llm_semaphore = asyncio.Semaphore(config.openai_concurrency)
+
+    # Evidence prefetch window: Arweave gateways have multi-hundred-ms
+    # TTFB, so fetches are kicked off ahead of audit slots becoming free.
+    # The semaphore caps in-flight gateway requests.
+    prefetch_semaphore = asyncio.Semaphore(config.arweave_concurrency)
+
+    async def _prefetch_evidence(evidence_cid: str) -> dict:
+        async with prefetch_semaphore:
+            return await arweave.fetch_evidence(evidence_cid)
+
+    async def _audit_studio_evidence(
+        studio_address, details, cids, evidence_tasks
+    ) -> dict[str, list[int] | BaseException]:
+        """Fetch and audit a studio's unique evidence packages in bulk.
+
+        One :meth:`Auditor.audit_many` call covers every unique CID the
+        cycle surfaced for this studio, so N new submissions cost
+        ``ceil(N / 8)`` LLM round-trips instead of N.  Every submission
+        carrying one of these CIDs shares the resulting scores.
+
+        Fetch failures are isolated per CID: an unfetchable package (a
+        worker submitting a garbage CID, say) maps to its exception in
+        the returned dict instead of failing the whole studio, and the
+        remaining packages are audited normally.
+        """
+        async with audit_semaphore:
+            logger.info(
+                "verifier.auditing_evidence",
+                studio=studio_address,
+                evidence_count=len(cids),
+            )
+
+            # Evidence was prefetched; by the time an audit slot frees
+            # up the gateway fetches have usually already completed.
+            fetched = await asyncio.gather(*evidence_tasks, return_exceptions=True)
+
+            ok_cids = [
+                cid
+                for cid, pkg in zip(cids, fetched)
+                if not isinstance(pkg, BaseException)
+            ]
+            scores: list[list[int]] = []
+            if ok_cids:
+                async with llm_semaphore:
+                    scores = await auditor.audit_many(
+                        evidence_packages=[
+                            pkg
+                            for pkg in fetched
+                            if not isinstance(pkg, BaseException)
+                        ],
+                        question=details.question,
+                        options=details.options,
+                    )
 
-    while True:
+        results: dict[str, list[int] | BaseException] = dict(zip(ok_cids, scores))
+        for cid, pkg in zip(cids, fetched):
+            if isinstance(pkg, BaseException):
+                logger.error(
+                    "verifier.evidence_fetch_error",
+                    studio=studio_address,
+                    evidence_cid=cid,
+                    error=repr(pkg),
+                )
+                results[cid] = pkg
+        return results
+
+    async def _score_one(studio_address, submission, audit_task) -> tuple[str, str]:
+        """Submit scores for one submission; returns the scored pair.
+
+        Awaits the (shared, per-studio) audit task before taking a
+        semaphore slot, so waiting on a shared audit can never hold up
+        the audit pipeline itself.
+        """
+        scores = (await audit_task)[submission.evidence_cid]
+        if isinstance(scores, BaseException):
+            # The fetch for this CID failed; only the submissions that
+            # reference it fail (and re-queue), not the whole studio.
+            raise scores
+
+        async with audit_semaphore:
+            await sdk_client.submit_scores(
+                studio_address=studio_address,
+                worker_address=submission.worker_address,
+                scores=scores,
+            )
+
+        logger.info(
+            "verifier.scores_submitted",
+            studio=studio_address,
+            worker=submission.worker_address,
+            scores=scores,
+        )
+        return (studio_address, submission.worker_address)
+
+    async def _process_studio(studio_address: str, details) -> None:
+        """Audit and score every pending submission for one studio.
+
+        Runs as one task per studio so cross-studio latency (receipt
+        waits, unscored-submission reads) overlaps; the audit / LLM /
+        submit semaphores still bound the total fan-out.
+        """
+        nonlocal cycle_productive
         try:
-            studios = registry.get_active_studios()
-
-            for studio_address in studios:
-                try:
-                    # Fetch studio details to check if epoch is still open
-                    details = registry.get_studio_details(studio_address)
-                    if details.epoch_closed:
-                        continue
-
-                    # Only look at studios that have at least one worker submission
-                    if details.worker_count == 0:
-                        continue
-
-                    # Get submissions not yet scored by this verifier
-                    unscored = registry.get_unscored_submissions(
-                        studio_address=studio_address,
-                        verifier_address=sdk_client.wallet_address,
+            # Assume this visit settles the studio; failure paths
+            # below re-queue it.
+            retry_studios.discard(studio_address)
+
+            # Check whether the epoch is still open
+            if details.epoch_closed:
+                return
+
+            # Only look at studios that have at least one worker submission
+            if details.worker_count == 0:
+                return
+
+            # Get submissions not yet scored by this verifier
+            unscored = await registry.aget_unscored_submissions(
+                studio_address=studio_address,
+                verifier_address=sdk_client.wallet_address,
+            )
+
+            # Audit all new submissions for this studio in
+            # parallel; exceptions come back as results so one
+            # failure never cancels the others.
+            pending = [
+                sub
+                for sub in unscored
+                if f"{studio_address}|{sub.worker_address}" not in scored_bloom
+                or (studio_address, sub.worker_address) not in scored_pairs
+            ]
+            if not pending:
+                return
+
+            # One fetch per unique CID, one batched audit
+            # for the whole studio: workers that share
+            # templates (or retry) submit identical
+            # evidence, and the audit is a pure function of
+            # (evidence, question, options).  Only the
+            # per-worker on-chain submission stays per-sub.
+            cids = sorted({sub.evidence_cid for sub in pending})
+            audit_task = asyncio.create_task(
+                _audit_studio_evidence(
+                    studio_address,
+                    details,
+                    cids,
+                    [
+                        asyncio.create_task(_prefetch_evidence(cid))
+                        for cid in cids
+                    ],
+                )
+            )
+            results = await asyncio.gather(
+                *(
+                    _score_one(studio_address, sub, audit_task)
+                    for sub in pending
+                ),
+                return_exceptions=True,
+            )
+            for sub, result in zip(pending, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "verifier.submission_audit_error",
+                        studio=studio_address,
+                        worker=sub.worker_address,
+                        error=repr(result),
                     )
-
-                    for submission in unscored:
-                        pair = (studio_address, submission.worker_address)
-                        if pair in scored_pairs:
-                            continue
-
-                        logger.info(
-                            "verifier.auditing_submission",
-                            studio=studio_address,
-                            worker=submission.worker_address,
-                            evidence_cid=submission.evidence_cid,
-                        )
-
-                        try:
-                            # 1. Fetch evidence from Arweave
-                            evidence_package = await arweave.fetch_evidence(
-                                submission.evidence_cid,
-                            )
-
-                            # 2. Audit the evidence
-                            scores = await auditor.audit(
-                                evidence_package=evidence_package,
-                                question=details.question,
-                                options=details.options,
-                            )
-
-                            # 3. Submit scores on-chain
-                            await sdk_client.submit_scores(
-                                studio_address=studio_address,
-                                worker_address=submission.worker_address,
-                                scores=scores,
-                            )
-
-                            scored_pairs.add(pair)
-                            logger.info(
-                                "verifier.scores_submitted",
-                                studio=studio_address,
-                                worker=submission.worker_address,
-                                scores=scores,
-                            )
-
-                        except Exception:
-                            logger.exception(
-                                "verifier.submission_audit_error",
-                                studio=studio_address,
-                                worker=submission.worker_address,
-                            )
-                            # Do not add to scored_pairs -- retry next cycle.
-
-                except Exception:
-                    logger.exception("verifier.studio_processing_error", studio=studio_address)
+                    # Not added to scored_pairs; re-queue the
+                    # studio so the next cycle retries it.
+                    retry_studios.add(studio_address)
+                else:
+                    scored_pairs.add(result)
+                    scored_bloom.add("|".join(result))
+                    state_store.add_scored(*result)
+                    cycle_productive = True
 
         except Exception:
-            logger.exception("verifier.poll_cycle_error")
+            logger.exception("verifier.studio_processing_error", studio=studio_address)
+            retry_studios.add(studio_address)
 
-        await asyncio.sleep(config.poll_interval_seconds)
+    # -- Poll loop -----------------------------------------------------------
+    logger.info("verifier.loop.start", poll_interval=config.poll_interval_seconds)
+
+    # Adaptive cadence: immediate-ish re-poll after productive cycles to
+    # drain queued submissions, exponential backoff while the RPC
+    # endpoint is failing, steady poll_interval when idle.
+    consecutive_failures = 0
+
+    try:
+        while True:
+            cycle_productive = False
+            try:
+                if next_block is None:
+                    # Startup / resync: pin the event cursor before the
+                    # full scan so anything landing in between shows up
+                    # twice (the sets dedupe) rather than never.
+                    next_block = await registry.acurrent_block() + 1
+                    if studios is None:
+                        studios = await registry.aget_active_studios()
+                    active_studios.update(studios)
+                    studios = None
+                    studios_to_check = set(active_studios)
+                    fresh_work = set()
+                else:
+                    # Steady state: two bounded log deltas instead of
+                    # rescanning every active studio.  Only studios with
+                    # fresh work (or fresh studios) are re-checked.
+                    created, cursor_a = await registry.aget_new_studios_since(
+                        next_block
+                    )
+                    new_work, cursor_b = await registry.aget_new_submissions_since(
+                        next_block
+                    )
+                    next_block = min(cursor_a, cursor_b)
+                    active_studios.update(created)
+                    studios_to_check = set(created)
+                    # The submission scan is topic-only, so drop events
+                    # from contracts that aren't registry studios.
+                    fresh_work = {
+                        s for s, _worker in new_work if s in active_studios
+                    }
+                    studios_to_check.update(fresh_work)
+
+                # Re-check studios whose work failed in an earlier cycle.
+                studios_to_check.update(retry_studios)
+
+                # Prefetch all studio details in one batch instead of one
+                # round-trip per studio.  Studios with a WorkSubmitted
+                # event this cycle bypass the details TTL cache: a
+                # seconds-old snapshot with worker_count == 0 would
+                # otherwise swallow the event for good.
+                details_map = await registry.aget_many_studio_details(
+                    sorted(studios_to_check),
+                    refresh=fresh_work,
+                )
+
+                # One task per studio: cross-studio waits (receipts,
+                # submission reads) overlap instead of accumulating
+                # linearly, and _process_studio swallows its own
+                # failures, so the gather never raises.
+                await asyncio.gather(
+                    *(
+                        _process_studio(studio_address, details_map[studio_address])
+                        for studio_address in sorted(studios_to_check)
+                    )
+                )
+
+                consecutive_failures = 0
+
+            except Exception:
+                logger.exception("verifier.poll_cycle_error")
+                # Resync with a full scan next cycle in case the delta
+                # cursor is no longer trustworthy.
+                next_block = None
+                consecutive_failures += 1
+
+            if consecutive_failures:
+                delay = min(
+                    config.max_backoff_seconds,
+                    config.poll_interval_seconds * 2**consecutive_failures,
+                )
+            elif cycle_productive:
+                delay = config.fast_poll_interval_seconds
+            else:
+                delay = config.poll_interval_seconds
+            await asyncio.sleep(delay)
+    finally:
+        await arweave.aclose()
+        await auditor.aclose()
+        await http_session.close()
+        state_store.close()
 
 
 # ---------------------------------------------------------------------------
@@ -219,20 +503,32 @@ async def run(config: VerifierConfig) -> NoReturn:
 
 def main() -> None:
     """Parse config, wire signal handlers, and launch the async loop."""
-    config = VerifierConfig()  # type: ignore[call-arg]
+    config = get_verifier_config()
+
+    # uvloop's libuv-backed loop has much lower per-await overhead than
+    # the default selector loop, which matters for this I/O-bound agent.
+    # Optional: unavailable on Windows and in bare dev environments.
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup
+        pass
+    else:
+        uvloop.install()
+        logger.info("verifier.uvloop_installed")
 
     loop = asyncio.new_event_loop()
 
     shutdown_event = asyncio.Event()
 
-    def _signal_handler(sig: signal.Signals, _frame: object) -> None:  # noqa: N803
-        logger.info("verifier.signal_received", signal=sig.name)
-        shutdown_event.set()
-
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        signal.signal(sig, _signal_handler)
-
     async def _run_until_shutdown() -> None:
+        # add_signal_handler runs the callback on the loop itself -- the
+        # async-safe mechanism, unlike signal.signal whose handler fires
+        # at an arbitrary interpreter point where Event.set() isn't
+        # guaranteed safe.  Shutdown latency drops to one loop iteration.
+        running_loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            running_loop.add_signal_handler(sig, shutdown_event.set)
+
         task = asyncio.create_task(run(config))
         await shutdown_event.wait()
         logger.info("verifier.shutting_down")
@@ -68,6 +68,16 @@ class WorkerConfig(BaseSettings):
         ge=5,
         description="Seconds between registry poll cycles.",
     )
+    fast_poll_interval_seconds: float = Field(
+        default=1.0,
+        ge=0.1,
+        description="Shortened poll delay after a cycle that processed work.",
+    )
+    max_backoff_seconds: float = Field(
+        default=300.0,
+        ge=5.0,
+        description="Ceiling for exponential backoff after consecutive failed cycles.",
+    )
 
     # ---- Staking ----
     worker_stake: int = Field(
@@ -81,6 +91,19 @@ class WorkerConfig(BaseSettings):
         description="Deployed ChaosOracleRegistry address on Sepolia.",
     )
 
+    # ---- Dedup sizing ----
+    bloom_expected_items: int = Field(
+        default=100_000,
+        ge=1,
+        description="Sizing target for the participated-studio Bloom prefilter.",
+    )
+
+    # ---- State persistence ----
+    state_db_path: str = Field(
+        default="worker_state.db",
+        description="SQLite file persisting participated studios across restarts.",
+    )
+
     # ---- Arweave ----
     arweave_wallet_path: str = Field(
         default="",
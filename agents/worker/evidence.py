@@ -14,6 +14,11 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Bound once at module scope; build() is per-submission hot path and
+# this skips the datetime.now / timezone.utc attribute walks per call.
+_utc_now = datetime.now
+_UTC = timezone.utc
+
 
 class EvidenceBuilder:
     """Builds evidence packages from research results.
@@ -36,6 +41,11 @@ class EvidenceBuilder:
             "reasoning": str,
             "timestamp": str (ISO-8601)
         }
+
+    The in-memory package carries ``timestamp`` as a raw aware
+    :class:`~datetime.datetime`; the Arweave client serialises it to an
+    ISO-8601 ``Z``-suffixed string at upload time, which is cheaper than
+    formatting the string here only for the encoder to copy it.
     """
 
     #: Current evidence package schema version.
@@ -83,8 +93,8 @@ class EvidenceBuilder:
         if not (0.0 <= confidence <= 1.0):
             raise ValueError(f"Confidence must be in [0, 1], got {confidence}.")
 
-        # Normalise sources to ensure consistent key names
-        normalised_sources = [
+        # Normalise sources to ensure consistent key names.
+        normalised_sources: list[dict[str, str]] = [
             {
                 "url": s.get("url", ""),
                 "title": s.get("title", ""),
@@ -100,7 +110,7 @@ class EvidenceBuilder:
             "confidence": round(confidence, 4),
             "sources": normalised_sources,
             "reasoning": reasoning,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_now(_UTC),
         }
 
         logger.info(
@@ -13,15 +13,26 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import logging
 import signal
 import sys
 from typing import NoReturn
 
+import aiohttp
 import structlog
 
+# orjson encodes the log event dicts in native code; every log line
+# goes through the renderer, so this is a blanket 3-5x on the encode.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from shared.arweave_client import ArweaveClient
+from shared.bloom import BloomFilter
 from shared.registry_reader import RegistryReader
 from shared.sdk_client import create_sdk_client
+from shared.state_store import StateStore
 from worker.config import WorkerConfig
 from worker.evidence import EvidenceBuilder
 from worker.researcher import Researcher
@@ -30,16 +41,29 @@ from worker.researcher import Researcher
 # Logging setup
 # ---------------------------------------------------------------------------
 
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """JSON renderer backed by orjson when the extension is available."""
+    if orjson is None:
+        return structlog.processors.JSONRenderer()
+    return structlog.processors.JSONRenderer(
+        serializer=lambda obj, **_kw: orjson.dumps(obj, default=str).decode()
+    )
+
+
+# Server-oriented config: no stack capture on ordinary log calls (walking
+# the stack on every info() in the per-studio loop is pure overhead --
+# ``logger.exception`` still attaches tracebacks) and JSON output instead
+# of the dev console renderer.  Filtering at INFO skips debug call sites
+# before any processor runs.
 structlog.configure(
     processors=[
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.set_exc_info,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(),
+        structlog.processors.format_exc_info,
+        _json_renderer(),
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(0),
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     context_class=dict,
     logger_factory=structlog.PrintLoggerFactory(),
     cache_logger_on_first_use=True,
@@ -52,21 +76,29 @@ logger = structlog.get_logger("worker.main")
 # ---------------------------------------------------------------------------
 
 
+# name -> NetworkConfig, built once on first gateway-mode resolution.
+# Lazy because chaoschain_sdk is only installed in gateway mode.
+_NETWORK_MAP: dict[str, object] | None = None
+
+
 def _resolve_network(name: str):
     """Map a config string to a :class:`NetworkConfig` value.
 
     Only imported when running in gateway mode (requires chaoschain_sdk).
     """
+    global _NETWORK_MAP
+
     from chaoschain_sdk import NetworkConfig
 
-    _map: dict[str, NetworkConfig] = {
-        "ethereum_sepolia": NetworkConfig.ETHEREUM_SEPOLIA,
-    }
-    try:
-        return _map[name.lower()]
-    except KeyError:
+    if _NETWORK_MAP is None:
+        _NETWORK_MAP = {
+            "ethereum_sepolia": NetworkConfig.ETHEREUM_SEPOLIA,
+        }
+    network = _NETWORK_MAP.get(name.lower())
+    if network is None:
         logger.warning("worker.unknown_network", name=name, fallback="ETHEREUM_SEPOLIA")
         return NetworkConfig.ETHEREUM_SEPOLIA
+    return network
 
 
 # ---------------------------------------------------------------------------
@@ -123,77 +155,187 @@ async def run(config: WorkerConfig) -> NoReturn:
 
     evidence_builder = EvidenceBuilder()
 
+    # One keep-alive HTTP pool shared across aiohttp-based components so
+    # warm iterations skip DNS + TCP + TLS setup.  The registry reader
+    # keeps its own pooled requests.Session (web3's HTTPProvider is
+    # synchronous).
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        ),
+    )
+
     arweave = ArweaveClient(
         wallet_path=config.arweave_wallet_path or None,
+        session=http_session,
     )
 
+    state_store = StateStore(config.state_db_path)
+
+    # -- State ---------------------------------------------------------------
+    # Reloaded from disk so a restart doesn't redo research and submit
+    # transactions that would only revert.
+    participated_studios: set[str] = state_store.load_participated()
+
+    # Bloom prefilter in front of the exact set: "definitely new" studios
+    # skip the big-set probe; a "maybe" still falls through to the exact
+    # check, since a Bloom false positive must never skip real work.
+    participated_bloom = BloomFilter(config.bloom_expected_items)
+    for _studio in participated_studios:
+        participated_bloom.add(_studio)
+
+    def _mark_participated(studio_address: str) -> None:
+        participated_studios.add(studio_address)
+        participated_bloom.add(studio_address)
+        state_store.add_participated(studio_address)
+
     # -- Identity registration -----------------------------------------------
-    agent_id = await sdk_client.auto_register()
+    # Identity registration (an on-chain tx in gateway mode) and the first
+    # registry scan are independent, so overlap them and hand the scan
+    # result to the first poll iteration.  Already-participated studios
+    # are dropped inside the reader rather than re-filtered here.
+    async def _initial_scan() -> list[str] | None:
+        try:
+            return await registry.aget_active_studios(exclude=participated_studios)
+        except Exception:
+            logger.exception("worker.initial_scan_failed")
+            return None
+
+    agent_id, studios = await asyncio.gather(
+        sdk_client.auto_register(),
+        _initial_scan(),
+    )
     logger.info("worker.identity_ready", agent_id=agent_id, wallet=sdk_client.wallet_address)
 
-    # -- State ---------------------------------------------------------------
-    participated_studios: set[str] = set()
+    # Incremental scan state: studios discovered so far, plus the next
+    # block to pull StudioCreated events from.  ``None`` forces a full
+    # registry scan (startup, or resync after an errored cycle).
+    active_studios: set[str] = set()
+    next_block: int | None = None
 
     # -- Poll loop -----------------------------------------------------------
     logger.info("worker.loop.start", poll_interval=config.poll_interval_seconds)
 
-    while True:
-        try:
-            studios = registry.get_active_studios()
-
-            for studio_address in studios:
-                if studio_address in participated_studios:
-                    continue
-
-                logger.info("worker.new_studio", studio=studio_address)
+    # Adaptive cadence: immediate-ish re-poll after productive cycles to
+    # drain queued studios, exponential backoff while the RPC endpoint
+    # is failing, steady poll_interval when idle.
+    consecutive_failures = 0
 
-                try:
-                    # 1. Read studio details
-                    details = registry.get_studio_details(studio_address)
+    try:
+        while True:
+            cycle_productive = False
+            try:
+                if next_block is None:
+                    # Startup / resync: pin the event cursor before the
+                    # full scan so anything landing in between shows up
+                    # twice (the set dedupes) rather than never.
+                    next_block = await registry.acurrent_block() + 1
+                    if studios is None:
+                        studios = await registry.aget_active_studios(
+                            exclude=participated_studios
+                        )
+                    active_studios.update(studios)
+                    studios = None
+                else:
+                    # Steady state: one bounded log delta instead of
+                    # rescanning the whole active list.
+                    created, next_block = await registry.aget_new_studios_since(
+                        next_block
+                    )
+                    active_studios.update(created)
+
+                # Prefetch details for all unseen studios in one batch
+                # instead of one round-trip per studio.
+                new_studios = [
+                    s
+                    for s in active_studios
+                    if s not in participated_bloom or s not in participated_studios
+                ]
+                details_map = await registry.aget_many_studio_details(new_studios)
+
+                # 1. Read studio details and drop closed epochs, then
+                # research the remaining questions through the batched
+                # LLM pipeline: ceil(N/8) Chat Completions requests for
+                # the cycle instead of one sequential call per studio.
+                to_research: list[str] = []
+                jobs: list[tuple[str, list[str]]] = []
+                for studio_address in new_studios:
+                    logger.info("worker.new_studio", studio=studio_address)
+                    details = details_map[studio_address]
                     if details.epoch_closed:
                         logger.info("worker.studio_closed_skipping", studio=studio_address)
-                        participated_studios.add(studio_address)
+                        _mark_participated(studio_address)
                         continue
-
-                    # 2. Research the question
-                    result = await researcher.research(details.question, details.options)
-
-                    # 3. Build evidence package
-                    evidence_package = evidence_builder.build(
-                        question=details.question,
-                        outcome=result.outcome_index,
-                        confidence=result.confidence,
-                        sources=result.sources,
-                        reasoning=result.reasoning,
-                    )
-
-                    # 4. Upload to Arweave
-                    evidence_cid = await arweave.upload_evidence(evidence_package)
-                    logger.info("worker.evidence_uploaded", cid=evidence_cid)
-
-                    # 5. Submit work on-chain
-                    await sdk_client.submit_work(
-                        studio_address=studio_address,
-                        outcome=result.outcome_index,
-                        evidence_cid=evidence_cid,
-                    )
-
-                    participated_studios.add(studio_address)
-                    logger.info(
-                        "worker.submission_complete",
-                        studio=studio_address,
-                        outcome=result.outcome_index,
-                        confidence=result.confidence,
-                    )
-
-                except Exception:
-                    logger.exception("worker.studio_processing_error", studio=studio_address)
-                    # Do not add to participated so we retry next cycle.
-
-        except Exception:
-            logger.exception("worker.poll_cycle_error")
-
-        await asyncio.sleep(config.poll_interval_seconds)
+                    to_research.append(studio_address)
+                    jobs.append((details.question, details.options))
+
+                # 2. Research all questions (cache hits and in-flight
+                # duplicates are served without an LLM call).
+                results = await researcher.research_batch(jobs)
+
+                for studio_address, result in zip(to_research, results):
+                    try:
+                        details = details_map[studio_address]
+
+                        # 3. Build evidence package
+                        evidence_package = evidence_builder.build(
+                            question=details.question,
+                            outcome=result.outcome_index,
+                            confidence=result.confidence,
+                            sources=result.sources,
+                            reasoning=result.reasoning,
+                        )
+
+                        # 4. Upload to Arweave
+                        evidence_cid = await arweave.upload_evidence(evidence_package)
+                        logger.info("worker.evidence_uploaded", cid=evidence_cid)
+
+                        # 5. Submit work on-chain
+                        await sdk_client.submit_work(
+                            studio_address=studio_address,
+                            outcome=result.outcome_index,
+                            evidence_cid=evidence_cid,
+                        )
+
+                        _mark_participated(studio_address)
+                        cycle_productive = True
+                        logger.info(
+                            "worker.submission_complete",
+                            studio=studio_address,
+                            outcome=result.outcome_index,
+                            confidence=result.confidence,
+                        )
+
+                    except Exception:
+                        logger.exception("worker.studio_processing_error", studio=studio_address)
+                        # Do not add to participated so we retry next cycle.
+
+                consecutive_failures = 0
+
+            except Exception:
+                logger.exception("worker.poll_cycle_error")
+                # Resync with a full scan next cycle in case the delta
+                # cursor is no longer trustworthy.
+                next_block = None
+                consecutive_failures += 1
+
+            if consecutive_failures:
+                delay = min(
+                    config.max_backoff_seconds,
+                    config.poll_interval_seconds * 2**consecutive_failures,
+                )
+            elif cycle_productive:
+                delay = config.fast_poll_interval_seconds
+            else:
+                delay = config.poll_interval_seconds
+            await asyncio.sleep(delay)
+    finally:
+        await arweave.aclose()
+        await researcher.aclose()
+        await http_session.close()
+        state_store.close()
 
 
 # ---------------------------------------------------------------------------
@@ -205,19 +347,31 @@ def main() -> None:
     """Parse config, wire signal handlers, and launch the async loop."""
     config = WorkerConfig()  # type: ignore[call-arg]
 
+    # uvloop's libuv-backed loop has much lower per-await overhead than
+    # the default selector loop, which matters for this I/O-bound agent.
+    # Optional: unavailable on Windows and in bare dev environments.
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup
+        pass
+    else:
+        uvloop.install()
+        logger.info("worker.uvloop_installed")
+
     loop = asyncio.new_event_loop()
 
     # Graceful shutdown on SIGTERM / SIGINT
     shutdown_event = asyncio.Event()
 
-    def _signal_handler(sig: signal.Signals, _frame: object) -> None:  # noqa: N803
-        logger.info("worker.signal_received", signal=sig.name)
-        shutdown_event.set()
-
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        signal.signal(sig, _signal_handler)
-
     async def _run_until_shutdown() -> None:
+        # add_signal_handler runs the callback on the loop itself -- the
+        # async-safe mechanism, unlike signal.signal whose handler fires
+        # at an arbitrary interpreter point where Event.set() isn't
+        # guaranteed safe.  Shutdown latency drops to one loop iteration.
+        running_loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            running_loop.add_signal_handler(sig, shutdown_event.set)
+
         task = asyncio.create_task(run(config))
         await shutdown_event.wait()
         logger.info("worker.shutting_down")
@@ -10,17 +10,333 @@ the most likely outcome for a prediction market question.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import random
+import re
+import time
+from collections import deque
 from dataclasses import dataclass
+from hashlib import blake2b
 from typing import Any
 
-import aiohttp
+import httpx
 import structlog
 
+# orjson parses and serialises in native code, a drop-in 2-5x win on the
+# small payloads here.  Fall back to stdlib so local dev environments
+# without the extension keep working.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# tiktoken counts prompt tokens for the context-budget guardrail below;
+# without it the guardrail is skipped and oversized prompts fail at the
+# API as before.
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None  # type: ignore[assignment]
+
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON using the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialise to JSON bytes ready to go on the wire."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+# OpenAI reset headers use compound Go-style durations ("6m12s", "120ms").
+_RESET_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RESET_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset_interval(value: str) -> float | None:
+    """Parse an ``x-ratelimit-reset-*`` header value into seconds."""
+    parts = _RESET_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(num) * _RESET_UNITS[unit] for num, unit in parts)
+
+
+# Transient statuses worth another attempt; everything else fails fast.
+_RETRY_ATTEMPTS = 3
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Settlement retries and racing workers re-ask the same (question,
+# options) within minutes; a short-TTL cache turns those repeats into
+# microsecond lookups instead of multi-second LLM calls.
+_RESEARCH_CACHE_TTL_SECONDS = 600.0
+
+
+# Built once: the placeholder search path returned these two dicts on
+# every call.  Plain dicts (not read-only proxies) because they flow
+# into orjson-serialised evidence packages downstream; callers that
+# modify snippets (the token-budget guardrail) copy first.
+_PLACEHOLDER_SOURCES: tuple[dict[str, str], ...] = (
+    {
+        "url": "https://example.com/placeholder-source-1",
+        "title": "Placeholder source 1",
+        "snippet": "This is a placeholder search result. Replace with real search API.",
+    },
+    {
+        "url": "https://example.com/placeholder-source-2",
+        "title": "Placeholder source 2",
+        "snippet": "This is a placeholder search result. Replace with real search API.",
+    },
+)
+
+
+def _research_cache_key(question: str, options: list[str]) -> str:
+    """Compact digest key for a (question, options) pair."""
+    raw = question + "\x00" + "\x00".join(options)
+    return blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+# Context budget for gpt-4o-class models: one pathological search
+# snippet (a whole article pasted as a "snippet") can push the prompt
+# past the per-request cap, producing a 400 that no retry fixes.  The
+# reserve leaves room for the model's JSON answer.
+_MODEL_CTX_TOKENS = 128_000
+_OUTPUT_TOKEN_RESERVE = 4_096
+
+
+def _build_user_prompt(
+    question: str,
+    options: list[str],
+    sources: list[dict[str, str]],
+) -> str:
+    """Assemble the single-question analysis prompt."""
+    options_text = "\n".join(f"  {i}: {opt}" for i, opt in enumerate(options))
+    sources_text = "\n".join(
+        f"  - [{s.get('title', 'N/A')}]({s.get('url', '')}): {s.get('snippet', '')}"
+        for s in sources
+    )
+    return (
+        f"Question: {question}\n\n"
+        f"Options:\n{options_text}\n\n"
+        f"Sources:\n{sources_text}\n\n"
+        "Analyze the evidence and select the most likely outcome."
+    )
+
+
+# Questions packed into one Chat Completions request by research_batch.
+# Each batch spends one request of RPM budget instead of one per
+# question; eight keeps the combined prompt well inside context limits.
+_MAX_RESEARCH_BATCH = 8
+
+_SYSTEM_PROMPT = (
+    "You are a prediction market research analyst. Given a market question, "
+    "possible outcomes, and web search results, determine the most likely "
+    "outcome. Respond ONLY with valid JSON matching this schema:\n"
+    '{"outcome_index": <int>, "confidence": <float 0-1>, "reasoning": "<string>"}'
+)
+
+def _outcome_response_format(option_count: int) -> dict[str, Any]:
+    """Strict structured-output format for a single-question verdict.
+
+    The server validates the reply against this schema (including the
+    ``outcome_index`` bounds), so the client no longer has to clamp and
+    re-validate every field it gets back.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "outcome",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "outcome_index": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "maximum": option_count - 1,
+                    },
+                    "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                    "reasoning": {"type": "string"},
+                },
+                "required": ["outcome_index", "confidence", "reasoning"],
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+# Batch variant: option counts differ per question, so outcome_index
+# only gets the lower bound here and the per-job clamp stays in the
+# batch parser.
+_BATCH_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "outcomes",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "outcome_index": {"type": "integer", "minimum": 0},
+                            "confidence": {
+                                "type": "number",
+                                "minimum": 0,
+                                "maximum": 1,
+                            },
+                            "reasoning": {"type": "string"},
+                        },
+                        "required": ["outcome_index", "confidence", "reasoning"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["results"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+_BATCH_SYSTEM_PROMPT = (
+    "You are a prediction market research analyst. You will receive several "
+    "independent market questions, each with its own outcome options and web "
+    "search results. For EACH question, determine the most likely outcome. "
+    "Respond ONLY with valid JSON matching this schema:\n"
+    '{"results": [{"outcome_index": <int>, "confidence": <float 0-1>, '
+    '"reasoning": "<string>"}, ...]}\n'
+    "with exactly one entry per question, in the order given."
+)
+
+
+class _RetryableStatus(RuntimeError):
+    """A retryable HTTP status, carrying any ``Retry-After`` hint."""
+
+    def __init__(self, status: int, retry_after: float | None) -> None:
+        super().__init__(f"OpenAI API error: {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class _AdaptiveLimiter:
+    """AIMD admission controller for the OpenAI request path.
+
+    A fixed concurrency cap is brittle: the provider's latency climbs
+    before it starts returning 429s, so a static limit either leaves
+    throughput on the table or melts down under throttling.  This
+    limiter additively raises the in-flight cap while the rolling mean
+    latency stays under target, halves it on throttle signals
+    (multiplicative decrease), and trips a circuit breaker that holds
+    new admissions for the provider's ``Retry-After`` window.
+
+    Parameters
+    ----------
+    initial:
+        Starting concurrency limit.
+    minimum, maximum:
+        Hard bounds the adaptive limit never leaves.
+    target_latency:
+        Rolling-mean request latency (seconds) considered healthy.
+    window:
+        Number of recent latencies in the rolling mean.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 32,
+        target_latency: float = 8.0,
+        window: int = 16,
+    ) -> None:
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._min = minimum
+        self._max = maximum
+        self._target = target_latency
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._inflight = 0
+        self._resume_at = 0.0
+        # Lazy: no event loop exists when the Researcher is constructed.
+        self._cond: asyncio.Condition | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current admission limit (floored to whole permits)."""
+        return max(self._min, int(self._limit))
+
+    async def __aenter__(self) -> "_AdaptiveLimiter":
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        # Circuit breaker: wait out any Retry-After window before even
+        # queueing for a permit.
+        while (delay := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._inflight < self.limit)
+            self._inflight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        assert self._cond is not None
+        async with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Feed one successful request latency; additively raise the cap."""
+        self._latencies.append(latency)
+        if (
+            len(self._latencies) == self._latencies.maxlen
+            and sum(self._latencies) / len(self._latencies) <= self._target
+            and self._limit < self._max
+        ):
+            self._limit = min(self._max, self._limit + 0.5)
+
+    def hold(self, seconds: float) -> None:
+        """Pause new admissions for *seconds* without shrinking the cap.
+
+        Used for header-driven pre-throttling: when the provider says
+        the request budget is nearly spent, waiting out the reset window
+        is cheaper than a 429 round-trip plus backoff.
+        """
+        if seconds > 0:
+            self._resume_at = max(
+                self._resume_at, time.monotonic() + min(seconds, 120.0)
+            )
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Halve the cap after a 429/5xx or transport error.
+
+        When the provider supplied ``Retry-After``, also hold all new
+        admissions until that window has passed.
+        """
+        self._limit = max(self._min, self._limit * 0.5)
+        self._latencies.clear()
+        if retry_after is not None and retry_after > 0:
+            self._resume_at = max(
+                self._resume_at, time.monotonic() + min(retry_after, 120.0)
+            )
+        logger.warning(
+            "researcher.limiter.throttled",
+            limit=self.limit,
+            retry_after=retry_after,
+        )
+
+
+# slots=True: instances carry typed attribute slots instead of a
+# __dict__, so constructing one per research call skips the dict
+# allocation and attribute reads go through fixed offsets.
+@dataclass(slots=True)
 class ResearchResult:
     """Structured result from a research run."""
 
@@ -39,22 +355,125 @@ class Researcher:
         API key for OpenAI (or compatible) LLM service.
     openai_model:
         Model identifier (e.g. ``gpt-4o``).
+    max_concurrency:
+        Cap on in-flight OpenAI requests.  Overridable per deployment
+        via the ``OPENAI_MAX_CONCURRENCY`` environment variable.
+    max_connections:
+        Total connection-pool cap.  High-RPM deployments should size
+        this at roughly ``rpm / 60 * avg_latency_s`` (e.g. ~2500 for
+        30k RPM at 5 s per call) so the pool never gates throughput.
+    max_keepalive:
+        Cap on pooled (keep-alive) connections.
+    request_timeout:
+        Total per-request timeout in seconds.
     """
 
     def __init__(
         self,
         openai_api_key: str = "",
         openai_model: str = "gpt-4o",
+        max_concurrency: int = 10,
+        max_connections: int = 200,
+        max_keepalive: int = 100,
+        request_timeout: float = 60.0,
     ) -> None:
         self._api_key = openai_api_key
         self._model = openai_model
+        self._client: httpx.AsyncClient | None = None
+        self._max_connections = max_connections
+        self._max_keepalive = max_keepalive
+        self._request_timeout = request_timeout
+
+        # Request headers never change; build them once.
+        self._headers = {
+            "Authorization": f"Bearer {openai_api_key}",
+            "Content-Type": "application/json",
+        }
+
+        # Unbounded fan-out just converts concurrency into 429 backoff;
+        # the adaptive limiter caps in-flight calls and self-tunes the
+        # cap from observed latency and throttle responses.
+        self._max_concurrency = int(
+            os.environ.get("OPENAI_MAX_CONCURRENCY", max_concurrency)
+        )
+        self._limiter = _AdaptiveLimiter(
+            initial=max(1, self._max_concurrency // 2),
+            maximum=self._max_concurrency,
+        )
 
-        logger.info(
+        # Sliding 60s window of (monotonic ts, total_tokens) per request,
+        # for observed-RPM/TPM visibility in the rate-budget logs.
+        self._usage_window: deque[tuple[float, int]] = deque()
+
+        # key -> (monotonic insert time, result); entries expire lazily
+        # on access after _RESEARCH_CACHE_TTL_SECONDS.
+        self._research_cache: dict[str, tuple[float, ResearchResult]] = {}
+
+        # key -> future for research currently in flight; concurrent
+        # callers for the same question await one shared LLM call.
+        self._inflight: dict[str, asyncio.Future[ResearchResult]] = {}
+
+        # tiktoken encoder, resolved once on first use --
+        # encoding_for_model does registry lookups worth caching.
+        self._encoder: Any = None
+
+        # Invariant context bound once; per-call logs reuse the frozen
+        # component/model keys instead of re-binding them every line.
+        self._log = logger.bind(component="researcher", model=openai_model)
+
+        self._log.info(
             "researcher.initialized",
             has_api_key=bool(openai_api_key),
             model=openai_model,
         )
 
+    # ------------------------------------------------------------------
+    # Session management
+    # ------------------------------------------------------------------
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP/2 client, creating it lazily.
+
+        One keep-alive pool across all research calls: skipping the
+        per-call TCP + TLS handshake to api.openai.com is the main
+        latency knob.  With HTTP/2 the server multiplexes many in-flight
+        completions over a single TLS connection, so high concurrency
+        stops translating into socket and file-descriptor pressure the
+        way one-connection-per-request HTTP/1.1 did.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_keepalive,
+                    keepalive_expiry=75.0,
+                ),
+                timeout=httpx.Timeout(self._request_timeout),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client.  Call from the agent shutdown hook."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def _prewarm_openai(self) -> None:
+        """Open a TLS connection to api.openai.com ahead of the POST.
+
+        Best-effort: runs concurrently with web search so the analysis
+        request usually finds a warm socket in the pool; a failure just
+        means the POST pays a cold handshake as before.
+        """
+        if not self._api_key:
+            return
+        try:
+            client = await self._get_client()
+            await client.head("https://api.openai.com/v1/models", timeout=5.0)
+        except Exception:
+            self._log.debug("researcher.prewarm_failed")
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -79,7 +498,10 @@ class Researcher:
             Contains the chosen outcome index, confidence score,
             supporting sources, and free-form reasoning text.
         """
-        logger.info(
+        # Hot-path bookkeeping logs run at debug: under the INFO
+        # filtering bound logger they short-circuit before building the
+        # event dict, so steady-state cycles don't pay for them.
+        self._log.debug(
             "researcher.research.start",
             question=question[:120],
             option_count=len(options),
@@ -95,7 +517,7 @@ class Researcher:
                         f"WORKER_FORCED_OUTCOME={forced_idx} out of range "
                         f"[0, {len(options)})"
                     )
-                logger.info(
+                self._log.info(
                     "researcher.forced_outcome",
                     outcome_index=forced_idx,
                     env_var="WORKER_FORCED_OUTCOME",
@@ -113,27 +535,70 @@ class Researcher:
                     reasoning=f"Forced outcome={forced_idx} via WORKER_FORCED_OUTCOME env var (local testing).",
                 )
             except (ValueError, TypeError) as exc:
-                logger.warning(
+                self._log.warning(
                     "researcher.invalid_forced_outcome",
                     value=forced,
                     error=str(exc),
                 )
                 # Fall through to normal research
 
-        # Step 1: Search the web for relevant information
-        sources = await self._web_search(question)
+        # Serve repeats (settlement retries, racing workers) from the
+        # TTL cache rather than re-paying search + LLM latency.
+        cache_key = _research_cache_key(question, options)
+        cached = self._research_cache.get(cache_key)
+        if cached is not None:
+            inserted_at, cached_result = cached
+            if time.monotonic() - inserted_at <= _RESEARCH_CACHE_TTL_SECONDS:
+                self._log.debug("researcher.research.cached", question=question[:80])
+                return cached_result
+            del self._research_cache[cache_key]
 
-        # Step 2: Analyze with LLM
-        analysis = await self._llm_analyze(question, options, sources)
+        # Single-flight: a settlement burst can ask for the same
+        # question from several coroutines before the first answer
+        # lands in the TTL cache.  Followers await the leader's future
+        # instead of issuing their own search + LLM calls.
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self._log.debug(
+                "researcher.research.joined_inflight", question=question[:80]
+            )
+            return await inflight
 
-        result = ResearchResult(
-            outcome_index=analysis["outcome_index"],
-            confidence=analysis["confidence"],
-            sources=sources,
-            reasoning=analysis["reasoning"],
+        fut: asyncio.Future[ResearchResult] = (
+            asyncio.get_running_loop().create_future()
         )
+        self._inflight[cache_key] = fut
+        try:
+            # Step 1: Search the web, prewarming the OpenAI connection in
+            # parallel -- the LLM call depends on the sources, but its TLS
+            # handshake doesn't.
+            sources, _ = await asyncio.gather(
+                self._web_search(question),
+                self._prewarm_openai(),
+            )
+
+            # Step 2: Analyze with LLM
+            analysis = await self._llm_analyze(question, options, sources)
 
-        logger.info(
+            result = ResearchResult(
+                outcome_index=analysis["outcome_index"],
+                confidence=analysis["confidence"],
+                sources=sources,
+                reasoning=analysis["reasoning"],
+            )
+            self._research_cache[cache_key] = (time.monotonic(), result)
+        except BaseException as exc:
+            fut.set_exception(exc)
+            # Mark retrieved so asyncio doesn't log "exception never
+            # retrieved" when no follower joined this flight.
+            fut.exception()
+            raise
+        else:
+            fut.set_result(result)
+        finally:
+            del self._inflight[cache_key]
+
+        self._log.info(
             "researcher.research.done",
             outcome_index=result.outcome_index,
             outcome_label=options[result.outcome_index] if result.outcome_index < len(options) else "?",
@@ -142,6 +607,115 @@ class Researcher:
         )
         return result
 
+    async def research_batch(
+        self,
+        jobs: list[tuple[str, list[str]]],
+    ) -> list[ResearchResult]:
+        """Research several market questions with batched LLM requests.
+
+        Packs up to ``_MAX_RESEARCH_BATCH`` questions per Chat
+        Completions call, spending one request of RPM budget per batch
+        instead of one per question at identical token cost.  Goes
+        through the same TTL cache and single-flight map as
+        :meth:`research`, so repeats and concurrent duplicates never
+        reach the LLM.
+
+        Parameters
+        ----------
+        jobs:
+            ``(question, options)`` tuples.
+
+        Returns
+        -------
+        list[ResearchResult]
+            One result per job, in input order.
+        """
+        if not jobs:
+            return []
+        # The forced-outcome test hook and the no-API-key placeholder
+        # are inherently per-question; delegate those to research().
+        if (
+            len(jobs) == 1
+            or not self._api_key
+            or os.environ.get("WORKER_FORCED_OUTCOME") is not None
+        ):
+            return [await self.research(q, opts) for q, opts in jobs]
+
+        # Same admission path as research(): serve TTL-cache hits, join
+        # flights already in progress (including duplicates inside this
+        # batch), and only send the remaining misses to the LLM.
+        results: list[ResearchResult | None] = [None] * len(jobs)
+        followers: list[tuple[int, asyncio.Future[ResearchResult]]] = []
+        misses: list[tuple[int, str, asyncio.Future[ResearchResult]]] = []
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        for i, (question, options) in enumerate(jobs):
+            key = _research_cache_key(question, options)
+            cached = self._research_cache.get(key)
+            if cached is not None:
+                inserted_at, cached_result = cached
+                if now - inserted_at <= _RESEARCH_CACHE_TTL_SECONDS:
+                    results[i] = cached_result
+                    continue
+                del self._research_cache[key]
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                followers.append((i, inflight))
+                continue
+            fut: asyncio.Future[ResearchResult] = loop.create_future()
+            self._inflight[key] = fut
+            misses.append((i, key, fut))
+
+        if misses:
+            try:
+                *sources_per_miss, _ = await asyncio.gather(
+                    *(self._web_search(jobs[i][0]) for i, _key, _fut in misses),
+                    self._prewarm_openai(),
+                )
+
+                for start in range(0, len(misses), _MAX_RESEARCH_BATCH):
+                    chunk = misses[start : start + _MAX_RESEARCH_BATCH]
+                    chunk_jobs = [jobs[i] for i, _key, _fut in chunk]
+                    chunk_sources = sources_per_miss[
+                        start : start + _MAX_RESEARCH_BATCH
+                    ]
+                    analyses = await self._call_openai_batch(
+                        chunk_jobs, chunk_sources
+                    )
+                    for (i, key, fut), sources, analysis in zip(
+                        chunk, chunk_sources, analyses
+                    ):
+                        result = ResearchResult(
+                            outcome_index=analysis["outcome_index"],
+                            confidence=analysis["confidence"],
+                            sources=sources,
+                            reasoning=analysis["reasoning"],
+                        )
+                        self._research_cache[key] = (time.monotonic(), result)
+                        results[i] = result
+                        fut.set_result(result)
+            except BaseException as exc:
+                for _i, _key, fut in misses:
+                    if not fut.done():
+                        fut.set_exception(exc)
+                        # Mark retrieved so asyncio doesn't log
+                        # "exception never retrieved" for unjoined flights.
+                        fut.exception()
+                raise
+            finally:
+                for _i, key, _fut in misses:
+                    self._inflight.pop(key, None)
+
+        for i, inflight in followers:
+            results[i] = await inflight
+
+        self._log.info(
+            "researcher.research_batch.done",
+            job_count=len(jobs),
+            llm_jobs=len(misses),
+        )
+        return results  # type: ignore[return-value]
+
     # ------------------------------------------------------------------
     # Web search (placeholder)
     # ------------------------------------------------------------------
@@ -158,34 +732,22 @@ class Researcher:
         list[dict]
             Each entry has keys ``url``, ``title``, and ``snippet``.
         """
-        logger.info("researcher.web_search.placeholder", query=query[:80])
+        self._log.debug("researcher.web_search.placeholder", query=query[:80])
 
         # TODO: Replace with a real search API integration.
         # Example with Tavily:
         #
-        #   async with aiohttp.ClientSession() as session:
-        #       async with session.post(
-        #           "https://api.tavily.com/search",
-        #           json={"query": query, "api_key": self._tavily_key},
-        #       ) as resp:
-        #           data = await resp.json()
-        #           return [
-        #               {"url": r["url"], "title": r["title"], "snippet": r["content"]}
-        #               for r in data.get("results", [])
-        #           ]
-
-        return [
-            {
-                "url": "https://example.com/placeholder-source-1",
-                "title": "Placeholder source 1",
-                "snippet": "This is a placeholder search result. Replace with real search API.",
-            },
-            {
-                "url": "https://example.com/placeholder-source-2",
-                "title": "Placeholder source 2",
-                "snippet": "This is a placeholder search result. Replace with real search API.",
-            },
-        ]
+        #   client = await self._get_client()
+        #   resp = await client.post(
+        #       "https://api.tavily.com/search",
+        #       json={"query": query, "api_key": self._tavily_key},
+        #   )
+        #   return [
+        #       {"url": r["url"], "title": r["title"], "snippet": r["content"]}
+        #       for r in resp.json().get("results", [])
+        #   ]
+
+        return list(_PLACEHOLDER_SOURCES)
 
     # ------------------------------------------------------------------
     # LLM analysis (placeholder)
@@ -215,7 +777,7 @@ class Researcher:
             return await self._call_openai(question, options, sources)
 
         # Fallback: deterministic placeholder that always picks the first option.
-        logger.warning(
+        self._log.warning(
             "researcher.llm_analyze.placeholder",
             msg="No API key configured; returning default outcome 0.",
         )
@@ -230,6 +792,58 @@ class Researcher:
             ),
         }
 
+    def _get_encoder(self) -> Any:
+        """Return the cached tiktoken encoder, or ``None`` if unavailable."""
+        if tiktoken is None:
+            return None
+        if self._encoder is None:
+            try:
+                self._encoder = tiktoken.encoding_for_model(self._model)
+            except KeyError:
+                self._encoder = tiktoken.get_encoding("o200k_base")
+        return self._encoder
+
+    def _fit_token_budget(
+        self,
+        question: str,
+        options: list[str],
+        sources: list[dict[str, str]],
+    ) -> str:
+        """Build the user prompt, shrinking snippets to fit the context cap.
+
+        While the counted prompt tokens plus the output reserve exceed
+        the model context, the longest source snippet is halved and the
+        prompt rebuilt.  The caller's source dicts are never mutated --
+        the evidence package keeps the full snippets.
+        """
+        prompt = _build_user_prompt(question, options, sources)
+        encoder = self._get_encoder()
+        if encoder is None or not sources:
+            return prompt
+
+        trimmed = sources
+        while (
+            len(encoder.encode(prompt)) + _OUTPUT_TOKEN_RESERVE
+            > _MODEL_CTX_TOKENS
+        ):
+            if trimmed is sources:
+                trimmed = [dict(s) for s in sources]
+            idx = max(
+                range(len(trimmed)),
+                key=lambda i: len(trimmed[i].get("snippet", "")),
+            )
+            snippet = trimmed[idx].get("snippet", "")
+            if len(snippet) <= 128:
+                break
+            trimmed[idx]["snippet"] = snippet[: len(snippet) // 2]
+            prompt = _build_user_prompt(question, options, trimmed)
+            self._log.warning(
+                "researcher.prompt_truncated",
+                source_url=trimmed[idx].get("url", ""),
+                snippet_chars=len(trimmed[idx]["snippet"]),
+            )
+        return prompt
+
     async def _call_openai(
         self,
         question: str,
@@ -240,86 +854,257 @@ class Researcher:
 
         Sends a structured prompt and expects a JSON response from the model.
         """
-        options_text = "\n".join(f"  {i}: {opt}" for i, opt in enumerate(options))
-        sources_text = "\n".join(
-            f"  - [{s.get('title', 'N/A')}]({s.get('url', '')}): {s.get('snippet', '')}"
-            for s in sources
-        )
+        user_prompt = self._fit_token_budget(question, options, sources)
+
+        payload = {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 1,
+            "response_format": _outcome_response_format(len(options)),
+        }
+
+        try:
+            content = await self._request_completion(payload)
+        except Exception:
+            self._log.exception("researcher.openai.call_failed")
+            # Graceful fallback
+            return {
+                "outcome_index": 0,
+                "confidence": 0.3,
+                "reasoning": f"LLM call failed; fallback to option 0 for '{question}'.",
+            }
 
-        system_prompt = (
-            "You are a prediction market research analyst. Given a market question, "
-            "possible outcomes, and web search results, determine the most likely "
-            "outcome. Respond ONLY with valid JSON matching this schema:\n"
-            '{"outcome_index": <int>, "confidence": <float 0-1>, "reasoning": "<string>"}'
+        # Strict mode guarantees the reply matches the schema, bounds
+        # included -- no clamping or key validation needed here.
+        result = _loads(content)
+        self._log.debug(
+            "researcher.openai.success",
+            outcome_index=result["outcome_index"],
+            confidence=result["confidence"],
         )
+        return result
+
+    async def _call_openai_batch(
+        self,
+        jobs: list[tuple[str, list[str]]],
+        sources_per_job: list[list[dict[str, str]]],
+    ) -> list[dict[str, Any]]:
+        """Analyze one chunk of questions in a single LLM request.
+
+        Returns one verdict dict per job; on any failure every job in
+        the chunk gets the graceful fallback verdict.
+        """
+        blocks: list[str] = []
+        for i, ((question, options), sources) in enumerate(
+            zip(jobs, sources_per_job)
+        ):
+            options_text = "\n".join(
+                f"  {j}: {opt}" for j, opt in enumerate(options)
+            )
+            sources_text = "\n".join(
+                f"  - [{s.get('title', 'N/A')}]({s.get('url', '')}): {s.get('snippet', '')}"
+                for s in sources
+            )
+            blocks.append(
+                f"### Question {i}\n{question}\n\n"
+                f"Options:\n{options_text}\n\n"
+                f"Sources:\n{sources_text}"
+            )
         user_prompt = (
-            f"Question: {question}\n\n"
-            f"Options:\n{options_text}\n\n"
-            f"Sources:\n{sources_text}\n\n"
-            "Analyze the evidence and select the most likely outcome."
+            "\n\n".join(blocks)
+            + "\n\nAnalyze each question independently and select its most "
+            "likely outcome."
         )
 
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
         payload = {
             "model": self._model,
             "messages": [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
             ],
             "temperature": 1,
-            "response_format": {"type": "json_object"},
+            "response_format": _BATCH_RESPONSE_FORMAT,
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as resp:
-                    if resp.status != 200:
-                        body = await resp.text()
-                        logger.error(
-                            "researcher.openai.error",
-                            status=resp.status,
-                            body=body[:500],
-                        )
-                        raise RuntimeError(f"OpenAI API error: {resp.status}")
-
-                    data = await resp.json()
-                    content = data["choices"][0]["message"]["content"]
+            content = await self._request_completion(payload)
+            raw_results = _loads(content).get("results", [])
+        except Exception:
+            self._log.exception("researcher.openai.batch_call_failed")
+            raw_results = []
 
-                    import json
-                    result = json.loads(content)
+        # Pad short (or failed) result arrays so every job gets a verdict.
+        if len(raw_results) < len(jobs):
+            raw_results = raw_results + [{}] * (len(jobs) - len(raw_results))
 
-                    # Validate expected keys
-                    outcome_index = int(result.get("outcome_index", 0))
-                    confidence = float(result.get("confidence", 0.5))
-                    reasoning = str(result.get("reasoning", ""))
+        analyses: list[dict[str, Any]] = []
+        for (question, options), raw in zip(jobs, raw_results):
+            if not isinstance(raw, dict) or "outcome_index" not in raw:
+                analyses.append(
+                    {
+                        "outcome_index": 0,
+                        "confidence": 0.3,
+                        "reasoning": (
+                            f"LLM batch call failed; fallback to option 0 "
+                            f"for '{question}'."
+                        ),
+                    }
+                )
+                continue
+            outcome_index = max(
+                0, min(int(raw.get("outcome_index", 0)), len(options) - 1)
+            )
+            confidence = max(0.0, min(float(raw.get("confidence", 0.5)), 1.0))
+            analyses.append(
+                {
+                    "outcome_index": outcome_index,
+                    "confidence": confidence,
+                    "reasoning": str(raw.get("reasoning", "")),
+                }
+            )
+        return analyses
 
-                    # Clamp to valid range
-                    outcome_index = max(0, min(outcome_index, len(options) - 1))
-                    confidence = max(0.0, min(confidence, 1.0))
+    async def _request_completion(self, payload: dict[str, Any]) -> str:
+        """Run one Chat Completions request and return the message content.
 
-                    logger.info(
-                        "researcher.openai.success",
-                        outcome_index=outcome_index,
-                        confidence=confidence,
+        Admission goes through the adaptive limiter.  Transient 429/5xx
+        and transport errors get retried with exponential backoff +
+        jitter while holding the permit, so a throttled endpoint sees
+        less pressure, not more.  Hand-rolled rather than pulling in
+        tenacity: one loop.
+        """
+        # The response is consumed as an SSE stream (see
+        # _post_completion); include_usage keeps the token accounting
+        # that a buffered response carried in its usage block.
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+        # Serialise once up front; retries reuse the same bytes and the
+        # POST skips the client's internal json= encoder.
+        body = _dumps_bytes(payload)
+        async with self._limiter:
+            for attempt in range(_RETRY_ATTEMPTS):
+                started = time.monotonic()
+                try:
+                    content = await self._post_completion(body)
+                except (_RetryableStatus, httpx.HTTPError) as exc:
+                    if not isinstance(exc, _RetryableStatus):
+                        self._limiter.record_throttle()
+                    if attempt == _RETRY_ATTEMPTS - 1:
+                        raise
+                    retry_after = getattr(exc, "retry_after", None)
+                    if retry_after is not None:
+                        delay = min(retry_after, 60.0)
+                    else:
+                        delay = min(60.0, 2.0**attempt) + random.uniform(0, 1.0)
+                    self._log.warning(
+                        "researcher.openai.retrying",
+                        attempt=attempt + 1,
+                        delay=round(delay, 2),
+                        error=repr(exc),
                     )
-                    return {
-                        "outcome_index": outcome_index,
-                        "confidence": confidence,
-                        "reasoning": reasoning,
-                    }
-        except Exception:
-            logger.exception("researcher.openai.call_failed")
-            # Graceful fallback
-            return {
-                "outcome_index": 0,
-                "confidence": 0.3,
-                "reasoning": f"LLM call failed; fallback to option 0 for '{question}'.",
-            }
+                    await asyncio.sleep(delay)
+                    continue
+                self._limiter.record_success(time.monotonic() - started)
+                return content
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _note_rate_headers(self, headers: Any) -> None:
+        """Pre-throttle from the rate-limit headers on every response.
+
+        When the remaining request budget drops under ~10% (or 2
+        requests), hold new admissions for the advertised reset window
+        instead of paying for a 429 round-trip plus backoff.
+        """
+        try:
+            remaining = int(headers.get("x-ratelimit-remaining-requests", ""))
+        except ValueError:
+            return
+        try:
+            limit = int(headers.get("x-ratelimit-limit-requests", "0"))
+        except ValueError:
+            limit = 0
+
+        if remaining <= max(2, limit * 0.1):
+            reset = _parse_reset_interval(
+                headers.get("x-ratelimit-reset-requests", "")
+            )
+            hold = reset if reset is not None else 1.0
+            self._limiter.hold(hold)
+            self._log.warning(
+                "researcher.rate_budget_low",
+                remaining_requests=remaining,
+                hold_seconds=round(hold, 2),
+            )
+
+    def _record_usage(self, total_tokens: int) -> None:
+        """Track token spend over a sliding 60s window."""
+        now = time.monotonic()
+        self._usage_window.append((now, total_tokens))
+        while self._usage_window and now - self._usage_window[0][0] > 60.0:
+            self._usage_window.popleft()
+        self._log.debug(
+            "researcher.usage_window",
+            rpm=len(self._usage_window),
+            tpm=sum(tokens for _ts, tokens in self._usage_window),
+        )
+
+    async def _post_completion(self, body: bytes) -> str:
+        """Send one Chat Completions request and return the raw content.
+
+        The request asks for ``stream=True``, so the message content is
+        assembled incrementally from SSE delta events instead of
+        buffering the whole response before parsing.  Parse work
+        overlaps the network transfer, and a cancellation (timeout,
+        agent shutdown) drops the connection mid-stream rather than
+        paying for the remaining tokens.
+        """
+        client = await self._get_client()
+        async with client.stream(
+            "POST",
+            "https://api.openai.com/v1/chat/completions",
+            content=body,
+            headers=self._headers,
+        ) as resp:
+            if resp.status_code != 200:
+                error_body = (await resp.aread()).decode(errors="replace")
+                self._log.error(
+                    "researcher.openai.error",
+                    status=resp.status_code,
+                    body=error_body[:500],
+                )
+                if resp.status_code in _RETRYABLE_STATUSES:
+                    try:
+                        retry_after = float(resp.headers.get("Retry-After", ""))
+                    except ValueError:
+                        retry_after = None
+                    self._limiter.record_throttle(retry_after)
+                    raise _RetryableStatus(resp.status_code, retry_after)
+                raise RuntimeError(f"OpenAI API error: {resp.status_code}")
+
+            buf = bytearray()
+            total_tokens = 0
+            async for raw_line in resp.aiter_lines():
+                line = raw_line.strip()
+                if not line.startswith("data: "):
+                    continue
+                chunk = line[len("data: ") :]
+                if chunk == "[DONE]":
+                    break
+                event = _loads(chunk)
+                # The final usage event arrives with an empty choices
+                # array (stream_options.include_usage).
+                usage = event.get("usage")
+                if usage:
+                    total_tokens = usage.get("total_tokens", 0)
+                choices = event.get("choices")
+                if choices:
+                    piece = (choices[0].get("delta") or {}).get("content")
+                    if piece:
+                        buf += piece.encode()
+
+            self._note_rate_headers(resp.headers)
+            self._record_usage(total_tokens)
+            return bytes(buf).decode()